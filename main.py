@@ -1,9 +1,33 @@
 import argparse
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
 
-from src.experimental_design import ExperimentalDesign
+from src.experimental_design import ExperimentalDesign, to_json_value
+
+
+def _seed_list(value):
+    """
+    Convierte una lista de semillas separadas por comas en una lista de enteros.
+
+    Se usa como type= de --seeds para que argparse reciba un único token sea
+    cual sea el número de semillas.
+
+    Args:
+        value (str): Semillas separadas por comas (p. ej. "42,123,456")
+
+    Returns:
+        list: Lista de semillas
+    """
+    try:
+        return [int(seed) for seed in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"lista de semillas no válida: '{value}' (formato: 42,123,456)"
+        )
 
 
 def parse_arguments():
@@ -21,8 +45,8 @@ Ejemplos de uso:
   python main.py                                    # Configuración por defecto
   python main.py --mode A --verbose                 # Modo A con salida detallada
   python main.py --mode C --initial-strategy greedy # Modo C con estrategia greedy
-  python main.py --seeds 10 20 30 40 50             # Con semillas personalizadas
-  python main.py --mode B --seeds 1 2 3 --verbose   # Combinación de parámetros
+  python main.py --seeds 10,20,30,40,50             # Con semillas personalizadas
+  python main.py --mode B --seeds 1,2,3 --verbose   # Combinación de parámetros
         """,
     )
 
@@ -50,10 +74,9 @@ Ejemplos de uso:
 
     parser.add_argument(
         "--seeds",
-        type=int,
-        nargs="+",
+        type=_seed_list,
         default=[42, 123, 456, 789, 1024],
-        help="Lista de semillas para múltiples ejecuciones (default: 42 123 456 789 1024)",
+        help="Semillas separadas por comas para múltiples ejecuciones (default: 42,123,456,789,1024)",
     )
 
     parser.add_argument(
@@ -69,9 +92,130 @@ Ejemplos de uso:
         help="Ejecutar sin aplicar preprocesamiento a la matriz (default: False)",
     )
 
+    parser.add_argument(
+        "--text-report",
+        action="store_true",
+        help="Añadir el reporte de estadísticas en texto al archivo .txt (default: False)",
+    )
+
     return parser.parse_args()
 
 
+def _write_json_results(results, json_path):
+    """
+    Guarda los resultados del experimento en formato JSON.
+
+    Incluye la configuración y las estadísticas agregadas. Las métricas de
+    cada ejecución ya se han volcado al archivo .runs.jsonl, que se referencia
+    por su nombre.
+
+    Args:
+        results (dict): Resultado de ExperimentalDesign.run_multiple_experiments
+        json_path (Path): Ruta del archivo JSON de salida
+    """
+    data = {
+        "config": results["configuration"],
+        "statistics": {
+            metric: {stat: float(value) for stat, value in metric_stats.items()}
+            for metric, metric_stats in results["statistics"].items()
+            # Las claves "_..." son datos internos (p. ej. el array "_raw")
+            if not metric.startswith("_")
+        },
+        "runs": Path(results["runs_path"]).name,
+    }
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, default=to_json_value)
+
+
+def _process_matrix(task):
+    """
+    Ejecuta el diseño experimental completo para una matriz.
+
+    Se ejecuta en un proceso independiente: construye su propio
+    ExperimentalDesign y escribe sus propios archivos de resultados (.txt con
+    la salida de la ejecución, .json con los resultados estructurados y
+    .runs.jsonl con una línea por semilla).
+
+    Args:
+        task (tuple): (matrix_path, output_path, mode, seeds, max_iterations,
+                      initial_strategy, verbose, apply_preprocessing,
+                      text_report)
+
+    Returns:
+        Path: Ruta del archivo de resultados generado
+    """
+    (
+        matrix_path,
+        output_path,
+        mode,
+        seeds,
+        max_iterations,
+        initial_strategy,
+        verbose,
+        apply_preprocessing,
+        text_report,
+    ) = task
+    matrix_filename = Path(matrix_path).name
+
+    # Crear diseño experimental
+    experiment = ExperimentalDesign(
+        matrix_path=matrix_path,
+        max_iterations=max_iterations,
+        initial_strategy=initial_strategy,
+    )
+
+    if apply_preprocessing:
+        preprocessing_line = f"  - Modo de preprocesamiento: {mode}\n"
+    else:
+        preprocessing_line = "  - Preprocesamiento: DESACTIVADO\n"
+
+    # Encabezado del archivo en una sola escritura
+    header = "".join(
+        [
+            f"{'=' * 80}\n",
+            f"RESULTADOS EXPERIMENTALES - {matrix_filename}\n",
+            f"Fecha de ejecución: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"{'=' * 80}\n",
+            "Configuración:\n",
+            preprocessing_line,
+            f"  - Estrategia inicial: {initial_strategy}\n",
+            f"  - Semillas: {seeds}\n",
+            f"  - Iteraciones máximas: {max_iterations}\n",
+            f"  - Verbose: {verbose}\n",
+            f"{'=' * 80}\n\n",
+        ]
+    )
+
+    # Redirigir salida a archivo (con un buffer de 1 MiB en lugar de por líneas)
+    with (
+        open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f,
+        redirect_stdout(f),
+    ):
+        f.write(header)
+
+        # Ejecutar experimento
+        print(">>> Ejecutando experimento con múltiples semillas...")
+        results = experiment.run_multiple_experiments(
+            seeds=seeds,
+            mode=mode,
+            verbose=verbose,
+            apply_preprocessing=apply_preprocessing,
+            # Las matrices ya se reparten entre procesos: las semillas de
+            # cada matriz se ejecutan en serie para no saturar la CPU
+            parallel=False,
+            # Cada ejecución se escribe a disco en cuanto termina
+            runs_path=output_path.with_suffix(".runs.jsonl"),
+        )
+
+        # Imprimir reporte estadístico (opcional: los datos van al JSON)
+        if text_report:
+            experiment.print_statistics_report(results)
+
+    _write_json_results(results, output_path.with_suffix(".json"))
+
+    return output_path
+
+
 def main():
     """
     Función principal que ejecuta el diseño experimental del algoritmo Hill Climbing.
@@ -82,15 +226,19 @@ def main():
     # Parsear argumentos de línea de comandos
     args = parse_arguments()
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    matrices_dir = os.path.join(script_dir, "matrices")
-    results_dir = os.path.join(script_dir, "results")
+    script_dir = Path(__file__).resolve().parent
+    matrices_dir = script_dir / "matrices"
+    results_dir = script_dir / "results"
 
     # Crear carpeta de resultados si no existe
-    Path(results_dir).mkdir(exist_ok=True)
+    results_dir.mkdir(exist_ok=True)
 
     # Obtener todas las matrices
-    matrix_files = sorted([f for f in os.listdir(matrices_dir) if f.endswith(".txt")])
+    matrix_files = sorted(
+        entry.name
+        for entry in os.scandir(matrices_dir)
+        if entry.is_file() and entry.name.endswith(".txt")
+    )
 
     print(f"\n{'=' * 80}")
     print(f"EJECUCIÓN DE EXPERIMENTOS PARA {len(matrix_files)} MATRICES")
@@ -105,83 +253,52 @@ def main():
     print(f"Estrategia inicial: {args.initial_strategy}")
     print(f"Semillas: {args.seeds}")
     print(f"Verbose: {args.verbose}")
+    print(f"Reporte en texto: {args.text_report}")
     print(f"Iteraciones máximas: {args.max_iterations}")
     print(f"{'=' * 80}\n")
 
-    # Ejecutar experimento para cada matriz
+    # Timestamp común a todo el lote; el índice garantiza nombres únicos
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # Preparar una tarea por matriz: cada ejecución es independiente
+    tasks = []
     for i, matrix_filename in enumerate(matrix_files, 1):
-        matrix_path = os.path.join(matrices_dir, matrix_filename)
+        matrix_path = matrices_dir / matrix_filename
         matrix_name = Path(matrix_filename).stem  # Nombre sin extensión
 
-        # Generar timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
         # Nombre del archivo de salida
-        output_filename = f"{matrix_name}_{timestamp}.txt"
-        output_path = os.path.join(results_dir, output_filename)
+        output_filename = f"{matrix_name}_{timestamp}_{i:03d}.txt"
+        output_path = results_dir / output_filename
 
-        print(f"\n[{i}/{len(matrix_files)}] Procesando: {matrix_filename}")
+        print(f"[{i}/{len(matrix_files)}] Procesando: {matrix_filename}")
         print(f"     Guardando resultados en: {output_filename}")
 
-        # Crear diseño experimental
-        experiment = ExperimentalDesign(
-            matrix_path=matrix_path,
-            max_iterations=args.max_iterations,
-            initial_strategy=args.initial_strategy,
+        tasks.append(
+            (
+                str(matrix_path),
+                output_path,
+                args.mode,
+                args.seeds,
+                args.max_iterations,
+                args.initial_strategy,
+                args.verbose,
+                not args.no_preprocessing,
+                args.text_report,
+            )
         )
 
-        # Redirigir salida a archivo
-        with open(output_path, "w", encoding="utf-8") as f:
-            # Escribir encabezado
-            f.write(f"{'=' * 80}\n")
-            f.write(f"RESULTADOS EXPERIMENTALES - {matrix_filename}\n")
-            f.write(
-                f"Fecha de ejecución: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            )
-            f.write(f"{'=' * 80}\n")
-            f.write("Configuración:\n")
-            if args.no_preprocessing:
-                f.write(f"  - Preprocesamiento: DESACTIVADO\n")
-            else:
-                f.write(f"  - Modo de preprocesamiento: {args.mode}\n")
-            f.write(f"  - Estrategia inicial: {args.initial_strategy}\n")
-            f.write(f"  - Semillas: {args.seeds}\n")
-            f.write(f"  - Iteraciones máximas: {args.max_iterations}\n")
-            f.write(f"  - Verbose: {args.verbose}\n")
-            f.write(f"{'=' * 80}\n\n")
-
-            # Guardar stdout original
-            import sys
-
-            original_stdout = sys.stdout
-
-            try:
-                # Redirigir stdout al archivo
-                sys.stdout = f
-
-                # Ejecutar experimento
-                print(">>> Ejecutando experimento con múltiples semillas...")
-                results = experiment.run_multiple_experiments(
-                    seeds=args.seeds,
-                    mode=args.mode,
-                    verbose=args.verbose,
-                    apply_preprocessing=not args.no_preprocessing,
-                )
-
-                # Imprimir reporte estadístico
-                experiment.print_statistics_report(results)
-
-            finally:
-                # Restaurar stdout
-                sys.stdout = original_stdout
-
-        print(f"     ✓ Completado: {output_filename}")
+    # Ejecutar los experimentos en paralelo (un proceso por matriz)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for i, output_path in enumerate(executor.map(_process_matrix, tasks), 1):
+            print(f"[{i}/{len(matrix_files)}] ✓ Completado: {output_path.name}")
 
     print(f"\n{'=' * 80}")
     print("✓ TODOS LOS EXPERIMENTOS COMPLETADOS")
     print(f"{'=' * 80}")
     print(f"Resultados guardados en: {results_dir}/")
-    print(f"Total de archivos generados: {len(matrix_files)}")
+    print(
+        f"Matrices procesadas: {len(matrix_files)} (.txt, .json y .runs.jsonl por matriz)"
+    )
     print(f"{'=' * 80}\n")
 
 
@@ -8,17 +8,21 @@ Módulos principales:
 - utils: Funciones auxiliares
 """
 
-from .experimental_design import ExperimentalDesign
-from .hill_climbing_optimizer import HillClimbingOptimizer
-from .preprocessing import PreprocessingModes
-from .test_suite_minimizer import TestSuiteMinimizer
-from .utils import (
-    calculate_coverage_percentage,
-    check_full_coverage,
-    find_critical_requirements,
-    get_essential_tests,
-    list_available_matrices,
-)
+import importlib
+
+# Los submódulos (y NumPy) se importan al acceder por primera vez a cada símbolo
+# (PEP 562), de modo que "import src" no carga nada que no se vaya a usar
+_LAZY_IMPORTS = {
+    "ExperimentalDesign": "experimental_design",
+    "HillClimbingOptimizer": "hill_climbing_optimizer",
+    "PreprocessingModes": "preprocessing",
+    "TestSuiteMinimizer": "test_suite_minimizer",
+    "calculate_coverage_percentage": "utils",
+    "check_full_coverage": "utils",
+    "find_critical_requirements": "utils",
+    "get_essential_tests": "utils",
+    "list_available_matrices": "utils",
+}
 
 __all__ = [
     "TestSuiteMinimizer",
@@ -31,3 +35,29 @@ __all__ = [
     "check_full_coverage",
     "list_available_matrices",
 ]
+
+
+def __getattr__(name):
+    """
+    Importa bajo demanda los símbolos públicos del paquete.
+
+    Args:
+        name (str): Nombre del atributo solicitado
+
+    Returns:
+        object: Clase o función exportada por el submódulo correspondiente
+    """
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        # Guardarlo en el módulo para que los siguientes accesos no pasen por aquí
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    Incluye en dir(src) los símbolos públicos aunque aún no se hayan importado.
+    """
+    return sorted(set(globals()) | set(__all__))
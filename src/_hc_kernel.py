@@ -0,0 +1,150 @@
+"""
+Núcleos numéricos del Hill Climbing.
+
+Si Numba está instalado, los núcleos se compilan con @njit; si no, se usa una
+implementación equivalente con NumPy. Numba es una dependencia opcional.
+"""
+
+import numpy as np
+
+from src.utils import count_coverage_bits
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _first_removable_numpy(covers, order, count):
+    """
+    Busca, en el orden dado, el primer test que se puede eliminar de la
+    solución sin perder cobertura.
+
+    Un test se puede eliminar si no es el único test de la solución que cubre
+    alguno de sus requisitos (ningún requisito suyo tiene count == 1).
+
+    Args:
+        covers (numpy.ndarray): Matriz booleana de cobertura (tests x requisitos)
+        order (numpy.ndarray): Índices de los tests de la solución, en el orden
+                               en que se prueban
+        count (numpy.ndarray): Número de tests de la solución que cubren cada
+                               requisito
+
+    Returns:
+        int: Posición en order del primer test eliminable, o -1 si no hay ninguno
+    """
+    if not len(order):
+        return -1
+    removable = ~np.any(covers[order] & (count == 1), axis=1)
+    position = int(removable.argmax())
+    return position if removable[position] else -1
+
+
+def _is_covered_bitset_numpy(test_bits, selected_idx, full_mask):
+    """
+    Indica si los tests seleccionados cubren todos los requisitos de full_mask.
+
+    Args:
+        test_bits (numpy.ndarray): Bitsets de cobertura de los tests (uint64)
+        selected_idx (numpy.ndarray): Índices de los tests seleccionados
+        full_mask (numpy.ndarray): Bitset de los requisitos que hay que cubrir
+
+    Returns:
+        bool: True si el OR de los bitsets seleccionados es igual a full_mask
+    """
+    covered = np.bitwise_or.reduce(test_bits[selected_idx], axis=0)
+    return bool(np.array_equal(covered, full_mask))
+
+
+def _count_covered_bitset_numpy(test_bits, selected_idx):
+    """
+    Cuenta los requisitos cubiertos por los tests seleccionados.
+
+    Args:
+        test_bits (numpy.ndarray): Bitsets de cobertura de los tests (uint64)
+        selected_idx (numpy.ndarray): Índices de los tests seleccionados
+
+    Returns:
+        int: Número de bits a 1 en el OR de los bitsets seleccionados
+    """
+    covered = np.bitwise_or.reduce(test_bits[selected_idx], axis=0)
+    return count_coverage_bits(covered)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _first_removable_numba(covers, order, count):
+        """
+        Versión compilada de _first_removable_numpy: recorre las filas en orden
+        y se detiene en el primer test eliminable, sin crear arrays intermedios.
+        """
+        num_requirements = covers.shape[1]
+        for position in range(order.shape[0]):
+            test_idx = order[position]
+            removable = True
+            for req_idx in range(num_requirements):
+                if covers[test_idx, req_idx] and count[req_idx] == 1:
+                    removable = False
+                    break
+            if removable:
+                return position
+        return -1
+
+    @njit(cache=True)
+    def _is_covered_bitset_numba(test_bits, selected_idx, full_mask):
+        """
+        Versión compilada de _is_covered_bitset_numpy: acumula el OR de las
+        filas seleccionadas en una sola pasada, sin copiar la submatriz.
+        """
+        num_words = full_mask.shape[0]
+        covered = np.zeros(num_words, dtype=np.uint64)
+        for i in range(selected_idx.shape[0]):
+            row = selected_idx[i]
+            for word in range(num_words):
+                covered[word] |= test_bits[row, word]
+        for word in range(num_words):
+            if covered[word] != full_mask[word]:
+                return False
+        return True
+
+    @njit(cache=True)
+    def _popcount64(x):
+        """
+        Número de bits a 1 de una palabra uint64 (suma SWAR por bloques de 2,
+        4, 8... bits, sin multiplicaciones que desborden).
+        """
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = (x & np.uint64(0x3333333333333333)) + (
+            (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+        )
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        x = x + (x >> np.uint64(8))
+        x = x + (x >> np.uint64(16))
+        x = x + (x >> np.uint64(32))
+        return int(x & np.uint64(0x7F))
+
+    @njit(cache=True)
+    def _count_covered_bitset_numba(test_bits, selected_idx):
+        """
+        Versión compilada de _count_covered_bitset_numpy: acumula el OR de las
+        filas seleccionadas sin copiar la submatriz y cuenta sus bits.
+        """
+        num_words = test_bits.shape[1]
+        covered = np.zeros(num_words, dtype=np.uint64)
+        for i in range(selected_idx.shape[0]):
+            row = selected_idx[i]
+            for word in range(num_words):
+                covered[word] |= test_bits[row, word]
+        count = 0
+        for word in range(num_words):
+            count += _popcount64(covered[word])
+        return count
+
+    first_removable = _first_removable_numba
+    is_covered_bitset = _is_covered_bitset_numba
+    count_covered_bitset = _count_covered_bitset_numba
+else:
+    first_removable = _first_removable_numpy
+    is_covered_bitset = _is_covered_bitset_numpy
+    count_covered_bitset = _count_covered_bitset_numpy
@@ -0,0 +1,149 @@
+"""
+Núcleos numéricos del preprocesamiento.
+
+Si Numba está instalado, los núcleos se compilan con @njit; si no, se usa una
+implementación equivalente con NumPy. Numba es una dependencia opcional.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Con bitsets de hasta este número de palabras, comparar las palabras
+# directamente es más rápido que el producto de matrices (medido con matrices
+# aleatorias de 500 y 2000 filas: el punto de cruce está en torno a 128 bits)
+_PACKED_MAX_WORDS = 2
+
+# Número de pares (fila dominante, fila) que se evalúan a la vez: las filas
+# dominantes se recorren en bloques para no crear matrices filas x filas. Con
+# bloques más pequeños el producto de matrices pierde eficiencia
+_BLOCK_PAIRS = 1 << 22
+
+
+def _contains_packed(block_bits, bits):
+    """
+    Calcula qué filas contienen a cuáles comparando los bitsets palabra a
+    palabra: la fila i contiene a la fila j si j no tiene ningún bit que no
+    esté en i. Solo usa operaciones enteras sobre los datos empaquetados.
+
+    Args:
+        block_bits (numpy.ndarray): Bitsets de las filas i del bloque
+        bits (numpy.ndarray): Bitsets de todas las filas j (filas x palabras,
+                              uint64)
+
+    Returns:
+        numpy.ndarray: Matriz booleana contains[i, j] (bloque x filas)
+    """
+    contains = np.ones((block_bits.shape[0], bits.shape[0]), dtype=bool)
+    for word in range(bits.shape[1]):
+        contains &= (bits[None, :, word] & ~block_bits[:, word, None]) == 0
+    return contains
+
+
+def _contains_matmul(block_rows, rows, popcounts):
+    """
+    Calcula qué filas contienen a cuáles con un producto de matrices:
+    shared[i, j] es el número de bits comunes a ambas filas, y la fila i
+    contiene a la fila j si comparten todos los bits de j (en float32 el
+    recuento es exacto y el producto lo resuelve BLAS).
+
+    Args:
+        block_rows (numpy.ndarray): Filas i del bloque, desempaquetadas
+        rows (numpy.ndarray): Todas las filas j, desempaquetadas (float32)
+        popcounts (numpy.ndarray): Número de bits a 1 de cada fila j
+
+    Returns:
+        numpy.ndarray: Matriz booleana contains[i, j] (bloque x filas)
+    """
+    shared = block_rows @ rows.T
+    return shared == popcounts[None, :]
+
+
+def _dominated_rows_numpy(bits, popcounts, earlier_only):
+    """
+    Marca las filas estrictamente dominadas por alguna otra fila.
+
+    La fila i domina a la fila j si contiene todos sus bits y tiene al menos
+    uno más. Las filas i se evalúan por bloques contra todas las filas j; según
+    el ancho de los bitsets, la contención se calcula con operaciones enteras
+    sobre las palabras (pocos bits) o con un producto de matrices (muchos
+    bits).
+
+    Args:
+        bits (numpy.ndarray): Bitsets de las filas (filas x palabras, uint64)
+        popcounts (numpy.ndarray): Número de bits a 1 de cada fila
+        earlier_only (bool): Si es True, solo cuentan las filas anteriores
+                             (i < j); si no, cualquier fila
+
+    Returns:
+        numpy.ndarray: Máscara booleana de las filas dominadas
+    """
+    num_rows = bits.shape[0]
+    packed = bits.shape[1] <= _PACKED_MAX_WORDS
+    if not packed:
+        rows = np.unpackbits(bits.view(np.uint8), axis=1, bitorder="little")
+        rows = rows.astype(np.float32)
+
+    block_size = max(1, _BLOCK_PAIRS // max(num_rows, 1))
+    dominated = np.zeros(num_rows, dtype=bool)
+    for start in range(0, num_rows, block_size):
+        block = slice(start, start + block_size)
+        if packed:
+            contains = _contains_packed(bits[block], bits)
+        else:
+            contains = _contains_matmul(rows[block], rows, popcounts)
+        dominates = contains & (popcounts[block, None] > popcounts[None, :])
+        if earlier_only:
+            # Solo cuenta el triángulo superior (i < j)
+            dominates = np.triu(dominates, k=start + 1)
+        dominated |= dominates.any(axis=0)
+    return dominated
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _dominated_rows_numba(bits, popcounts, earlier_only):
+        """
+        Versión compilada de _dominated_rows_numpy. Cada fila solo se compara,
+        palabra a palabra, con las filas no dominadas ya recorridas y se detiene
+        en la primera que la domina: si la domina una fila dominada, también la
+        domina la fila que domina a esta.
+
+        Con earlier_only las filas se recorren en orden; si no, de más a menos
+        bits, de modo que cualquier fila dominante se recorre antes.
+        """
+        num_rows, num_words = bits.shape
+        if earlier_only:
+            order = np.arange(num_rows)
+        else:
+            order = np.argsort(-popcounts, kind="mergesort")
+        dominated = np.zeros(num_rows, dtype=np.bool_)
+        survivors = np.empty(num_rows, dtype=np.intp)
+        num_survivors = 0
+        for j in order:
+            for position in range(num_survivors):
+                i = survivors[position]
+                # Una fila solo puede dominar a otra con más bits
+                if popcounts[i] <= popcounts[j]:
+                    continue
+                contains = True
+                for word in range(num_words):
+                    if bits[j, word] & ~bits[i, word]:
+                        contains = False
+                        break
+                if contains:
+                    dominated[j] = True
+                    break
+            if not dominated[j]:
+                survivors[num_survivors] = j
+                num_survivors += 1
+        return dominated
+
+    dominated_rows = _dominated_rows_numba
+else:
+    dominated_rows = _dominated_rows_numpy
@@ -5,13 +5,134 @@ Permite ejecutar el algoritmo con múltiples semillas y calcular estadísticas
 como media, mínimo, máximo, desviación estándar y tiempo de ejecución.
 """
 
+import io
+import json
+import os
+import sys
+import tempfile
 import time
-from typing import Dict, List, Literal, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from functools import partial
+from typing import Dict, List, Literal, Optional, TextIO, Tuple
 
 import numpy as np
 
 from src.test_suite_minimizer import TestSuiteMinimizer
 
+# Métricas de cada ejecución sobre las que se calculan estadísticas
+STATISTICS_METRICS = (
+    "execution_time",
+    "cpu_time",
+    "solution_size",
+    "reduction",
+    "reduction_percentage",
+    "tssr",
+    "fdcloss",
+    "iterations",
+    "improvements",
+)
+
+# Plantilla del reporte de estadísticas (ver print_statistics_report)
+STATISTICS_REPORT_TEMPLATE = """
+{rule}
+REPORTE DE ESTADÍSTICAS - DISEÑO EXPERIMENTAL
+{rule}
+
+CONFIGURACIÓN:
+  Archivo: {matrix_path}
+  Modo de preprocesamiento: {mode}
+  Estrategia inicial: {initial_strategy}
+  Número de ejecuciones: {num_runs}
+  Semillas: {seeds}
+
+{rule}
+RESULTADOS AGREGADOS
+{rule}
+
+TIEMPO DE EJECUCIÓN (segundos):
+  Media:           {execution_time_mean:>10.4f}s
+  Mínimo:          {execution_time_min:>10.4f}s
+  Máximo:          {execution_time_max:>10.4f}s
+  Desv. Estándar:  {execution_time_std:>10.4f}s
+
+TIEMPO DE CPU (segundos):
+  Media:           {cpu_time_mean:>10.4f}s
+  Mínimo:          {cpu_time_min:>10.4f}s
+  Máximo:          {cpu_time_max:>10.4f}s
+  Desv. Estándar:  {cpu_time_std:>10.4f}s
+
+TAMAÑO DE SOLUCIÓN (tests):
+  Media:           {solution_size_mean:>10.2f}
+  Mínimo:          {solution_size_min:>10.0f}
+  Máximo:          {solution_size_max:>10.0f}
+  Desv. Estándar:  {solution_size_std:>10.2f}
+
+REDUCCIÓN (tests eliminados):
+  Media:           {reduction_mean:>10.2f}
+  Mínimo:          {reduction_min:>10.0f}
+  Máximo:          {reduction_max:>10.0f}
+  Desv. Estándar:  {reduction_std:>10.2f}
+
+PORCENTAJE DE REDUCCIÓN (%):
+  Media:           {reduction_percentage_mean:>10.2f}%
+  Mínimo:          {reduction_percentage_min:>10.2f}%
+  Máximo:          {reduction_percentage_max:>10.2f}%
+  Desv. Estándar:  {reduction_percentage_std:>10.2f}%
+
+TSSR (Test Suite Size Reduction):
+  Media:           {tssr_mean:>10.4f}
+  Mínimo:          {tssr_min:>10.4f}
+  Máximo:          {tssr_max:>10.4f}
+  Desv. Estándar:  {tssr_std:>10.4f}
+
+FDCLOSS (Fault Detection Capability Loss):
+  Media:           {fdcloss_mean:>10.4f}
+  Mínimo:          {fdcloss_min:>10.4f}
+  Máximo:          {fdcloss_max:>10.4f}
+  Desv. Estándar:  {fdcloss_std:>10.4f}
+
+ITERACIONES:
+  Media:           {iterations_mean:>10.2f}
+  Mínimo:          {iterations_min:>10.0f}
+  Máximo:          {iterations_max:>10.0f}
+  Desv. Estándar:  {iterations_std:>10.2f}
+
+MEJORAS:
+  Media:           {improvements_mean:>10.2f}
+  Mínimo:          {improvements_min:>10.0f}
+  Máximo:          {improvements_max:>10.0f}
+  Desv. Estándar:  {improvements_std:>10.2f}
+
+{rule}
+
+"""
+
+
+def to_json_value(value):
+    """
+    Convierte los tipos de NumPy a tipos nativos serializables en JSON.
+
+    Se usa como default= de json.dump/json.dumps.
+
+    Args:
+        value: Valor que json no sabe serializar
+
+    Returns:
+        Valor equivalente con tipos nativos de Python
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Tipo no serializable en JSON: {type(value).__name__}")
+
+
+# Minimizadores ya construidos en este proceso, por ruta de matriz: las semillas
+# siguientes solo llaman a reset() en lugar de volver a cargar la matriz. Cada
+# entrada solo vive mientras dura un experimento (ver _release_minimizer())
+_MINIMIZERS: Dict[str, TestSuiteMinimizer] = {}
+
 
 class ExperimentalDesign:
     """
@@ -35,6 +156,46 @@ class ExperimentalDesign:
         self.matrix_path = matrix_path
         self.max_iterations = max_iterations
         self.initial_strategy = initial_strategy
+        # Copia .npy de la matriz ya parseada, compartida entre ejecuciones (mmap)
+        self._matrix_cache_path: Optional[str] = None
+
+    def _create_matrix_cache(self) -> str:
+        """
+        Parsea la matriz una sola vez y la guarda en un archivo .npy temporal.
+
+        Las ejecuciones la abren con np.load(mmap_mode="r"), de modo que todos los
+        procesos comparten la misma copia en la caché de páginas del sistema en
+        lugar de volver a leer y parsear el archivo de texto en cada semilla.
+
+        Returns:
+            Ruta al archivo .npy creado
+        """
+        fd, cache_path = tempfile.mkstemp(prefix="coverage_matrix_", suffix=".npy")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, TestSuiteMinimizer.parse_matrix_file(self.matrix_path))
+        self._matrix_cache_path = cache_path
+        return cache_path
+
+    def _remove_matrix_cache(self):
+        """
+        Elimina el archivo .npy temporal creado por _create_matrix_cache().
+
+        Antes descarta el minimizador de este proceso, que puede seguir
+        leyendo la matriz del archivo a través del mmap.
+        """
+        if self._matrix_cache_path is not None:
+            self._release_minimizer()
+            os.remove(self._matrix_cache_path)
+            self._matrix_cache_path = None
+
+    def _release_minimizer(self):
+        """
+        Descarta el minimizador de esta matriz guardado en este proceso.
+
+        Así un experimento posterior con la misma ruta vuelve a leer el archivo
+        (que puede haber cambiado) y la matriz no queda en memoria al terminar.
+        """
+        _MINIMIZERS.pop(self.matrix_path, None)
 
     def run_single_experiment(
         self,
@@ -42,6 +203,7 @@ class ExperimentalDesign:
         mode: Literal["A", "B", "C"] = "A",
         verbose: bool = False,
         apply_preprocessing: bool = True,
+        _keep_cached: bool = False,
     ) -> Dict:
         """
         Ejecuta una única ejecución del algoritmo con una semilla específica.
@@ -51,24 +213,49 @@ class ExperimentalDesign:
             mode: Modo de preprocesamiento
             verbose: Mostrar información detallada
             apply_preprocessing: Si se debe aplicar preprocesamiento (True) o no (False)
+            _keep_cached: Uso interno. Conservar el minimizador para las
+                          siguientes semillas del mismo experimento; quien lo
+                          activa debe descartarlo al terminar (ver
+                          _release_minimizer())
 
         Returns:
             Diccionario con los resultados de la ejecución
         """
-        if seed is not None:
-            np.random.seed(seed)
-
-        # Crear minimizador
-        minimizer = TestSuiteMinimizer(
-            self.matrix_path,
-            max_iterations=self.max_iterations,
-            initial_strategy=self.initial_strategy,
-        )
-
-        # Medir tiempo de ejecución
-        start_time = time.time()
-        result = minimizer.run(mode=mode, apply_preprocessing=apply_preprocessing)
-        execution_time = time.time() - start_time
+        # Generador propio de esta ejecución (sin estado global compartido)
+        rng = np.random.default_rng(seed)
+
+        # Reutilizar el minimizador de este proceso si ya existe
+        minimizer = _MINIMIZERS.get(self.matrix_path)
+        if minimizer is None:
+            # Reutilizar la matriz ya parseada si hay una copia compartida: se
+            # usa directamente el mmap de solo lectura, sin copiarlo, para que
+            # todos los procesos compartan las mismas páginas. El minimizador
+            # se descarta antes de borrar el .npy (ver _remove_matrix_cache())
+            matrix = None
+            if self._matrix_cache_path is not None:
+                matrix = np.load(self._matrix_cache_path, mmap_mode="r")
+
+            minimizer = TestSuiteMinimizer(self.matrix_path, matrix=matrix)
+            _MINIMIZERS[self.matrix_path] = minimizer
+
+        minimizer.max_iterations = self.max_iterations
+        minimizer.initial_strategy = self.initial_strategy
+        minimizer.verbose = verbose
+        minimizer.reset(rng)
+
+        # Medir tiempo de ejecución (reloj monótono) y tiempo de CPU del proceso,
+        # que no incluye el tiempo esperando a otros procesos en paralelo
+        try:
+            start_time = time.perf_counter()
+            start_cpu_time = time.process_time()
+            result = minimizer.run(mode=mode, apply_preprocessing=apply_preprocessing)
+            execution_time = time.perf_counter() - start_time
+            cpu_time = time.process_time() - start_cpu_time
+        finally:
+            # Una llamada suelta no deja el minimizador en memoria: la siguiente
+            # vuelve a leer el archivo, por si ha cambiado
+            if not _keep_cached:
+                self._release_minimizer()
 
         # Extraer métricas relevantes
         optimization = result["optimization"]
@@ -76,6 +263,7 @@ class ExperimentalDesign:
         return {
             "seed": seed,
             "execution_time": execution_time,
+            "cpu_time": cpu_time,
             "solution_size": optimization["solution_size"],
             "original_size": optimization["original_size"],
             "reduction": optimization["reduction"],
@@ -95,6 +283,8 @@ class ExperimentalDesign:
         mode: Literal["A", "B", "C"] = "A",
         verbose: bool = False,
         apply_preprocessing: bool = True,
+        parallel: bool = True,
+        runs_path: Optional[str] = None,
     ) -> Dict:
         """
         Ejecuta múltiples experimentos con diferentes semillas.
@@ -105,6 +295,12 @@ class ExperimentalDesign:
             mode: Modo de preprocesamiento
             verbose: Mostrar información detallada
             apply_preprocessing: Si se debe aplicar preprocesamiento (True) o no (False)
+            parallel: Ejecutar las semillas en procesos independientes (False para
+                      ejecutarlas secuencialmente en el proceso actual)
+            runs_path: Archivo JSON Lines donde escribir cada ejecución en cuanto
+                       termina (sin la información de preprocesamiento). Si se
+                       indica, los resultados individuales no se guardan en
+                       memoria e individual_results es None
 
         Returns:
             Diccionario con estadísticas agregadas y resultados individuales
@@ -128,22 +324,34 @@ class ExperimentalDesign:
         print(f"Semillas: {seeds}")
         print(f"{'=' * 80}\n")
 
-        results = []
-        for i, seed in enumerate(seeds, 1):
-            print(f"\n--- Ejecución {i}/{len(seeds)} (Semilla: {seed}) ---")
-            result = self.run_single_experiment(
-                seed, mode, verbose, apply_preprocessing
-            )
-            results.append(result)
+        # Si las semillas se reparten entre procesos, la matriz se parsea una sola
+        # vez y se comparte como .npy; en secuencial, el minimizador del proceso
+        # la parsea directamente y se reutiliza entre semillas
+        created_cache = parallel and len(seeds) > 1 and self._matrix_cache_path is None
+        if created_cache:
+            self._create_matrix_cache()
+
+        runs_file = None
+        if runs_path is not None:
+            runs_file = open(runs_path, "w", encoding="utf-8")
 
-            # Mostrar resumen de esta ejecución
-            print(f"✓ Completada en {result['execution_time']:.4f}s")
+        try:
+            metrics, results = self._run_seeds(
+                seeds, mode, verbose, apply_preprocessing, parallel, runs_file
+            )
+        finally:
+            if runs_file is not None:
+                runs_file.close()
+            if created_cache:
+                self._remove_matrix_cache()
+            self._release_minimizer()
 
         # Calcular estadísticas
-        statistics = self._calculate_statistics(results)
+        statistics = self._calculate_statistics(metrics)
 
         return {
             "individual_results": results,
+            "runs_path": runs_path,
             "statistics": statistics,
             "configuration": {
                 "matrix_path": self.matrix_path,
@@ -155,37 +363,194 @@ class ExperimentalDesign:
             },
         }
 
-    def _calculate_statistics(self, results: List[Dict]) -> Dict:
+    def _run_seeds(
+        self,
+        seeds: List[int],
+        mode: Literal["A", "B", "C"],
+        verbose: bool,
+        apply_preprocessing: bool,
+        parallel: bool,
+        runs_file: Optional[TextIO] = None,
+    ) -> Tuple[np.ndarray, Optional[List[Dict]]]:
         """
-        Calcula estadísticas agregadas de múltiples ejecuciones.
+        Ejecuta una vez el algoritmo por cada semilla.
 
         Args:
-            results: Lista de resultados individuales
+            seeds: Lista de semillas
+            mode: Modo de preprocesamiento
+            verbose: Mostrar información detallada
+            apply_preprocessing: Si se debe aplicar preprocesamiento (True) o no (False)
+            parallel: Ejecutar las semillas en procesos independientes
+            runs_file: Archivo JSON Lines abierto donde volcar cada ejecución (None
+                       para conservar los resultados en memoria)
 
         Returns:
-            Diccionario con estadísticas (media, min, max, std)
+            Tupla (métricas de cada ejecución como array de len(seeds) x
+            len(STATISTICS_METRICS), lista de resultados en el orden de las
+            semillas o None si se han volcado a runs_file)
+        """
+        metrics = np.empty((len(seeds), len(STATISTICS_METRICS)), dtype=np.float64)
+        results = [None] * len(seeds) if runs_file is None else None
+
+        if parallel and len(seeds) > 1:
+            # Cada semilla es una ejecución independiente: repartirlas entre procesos
+            run_seed = partial(
+                self._run_seed,
+                mode=mode,
+                verbose=verbose,
+                apply_preprocessing=apply_preprocessing,
+            )
+            max_workers = min(len(seeds), os.cpu_count() or 1)
+            outputs = [""] * len(seeds)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(run_seed, seed): position
+                    for position, seed in enumerate(seeds)
+                }
+                # Guardar cada semilla en cuanto termina, sin esperar al resto
+                for future in as_completed(futures):
+                    position = futures[future]
+                    result, outputs[position] = future.result()
+                    self._store_run(result, position, metrics, results, runs_file)
+
+            # Volcar la salida de cada ejecución en el orden de las semillas
+            for i, (seed, output) in enumerate(zip(seeds, outputs), 1):
+                print(f"\n--- Ejecución {i}/{len(seeds)} (Semilla: {seed}) ---")
+                sys.stdout.write(output)
+        else:
+            for i, seed in enumerate(seeds, 1):
+                print(f"\n--- Ejecución {i}/{len(seeds)} (Semilla: {seed}) ---")
+                # run_multiple_experiments() descarta el minimizador al terminar
+                result = self.run_single_experiment(
+                    seed, mode, verbose, apply_preprocessing, _keep_cached=True
+                )
+                self._store_run(result, i - 1, metrics, results, runs_file)
+
+        # Resumen de todas las ejecuciones, independiente del orden en que terminen
+        self._print_runs_summary(seeds, metrics)
+
+        return metrics, results
+
+    @staticmethod
+    def _print_runs_summary(seeds: List[int], metrics: np.ndarray):
+        """
+        Imprime una tabla con el tiempo y el tamaño de solución de cada ejecución,
+        ordenada por semilla.
+
+        Args:
+            seeds: Lista de semillas
+            metrics: Array de métricas por ejecución (ver _run_seeds)
         """
-        metrics = [
-            "execution_time",
-            "solution_size",
-            "reduction",
-            "reduction_percentage",
-            "tssr",
-            "fdcloss",
-            "iterations",
-            "improvements",
+        time_column = STATISTICS_METRICS.index("execution_time")
+        size_column = STATISTICS_METRICS.index("solution_size")
+        rule = "-" * 40
+
+        lines = [
+            f"\n{rule}",
+            f"{'Semilla':>12} | {'Tiempo (s)':>12} | {'Tests':>8}",
+            rule,
         ]
+        for position in sorted(range(len(seeds)), key=seeds.__getitem__):
+            lines.append(
+                f"{seeds[position]:>12} | "
+                f"{metrics[position, time_column]:>12.4f} | "
+                f"{metrics[position, size_column]:>8.0f}"
+            )
+        lines.append(rule)
+        print("\n".join(lines))
+
+    @staticmethod
+    def _store_run(
+        result: Dict,
+        position: int,
+        metrics: np.ndarray,
+        results: Optional[List[Dict]],
+        runs_file: Optional[TextIO],
+    ):
+        """
+        Guarda el resultado de una ejecución en cuanto termina.
+
+        Las métricas escalares siempre se copian a su fila de metrics; el
+        resultado completo se guarda en results o, si se vuelca a disco, se
+        escribe como una línea de runs_file y se descarta.
 
-        statistics = {}
-        for metric in metrics:
-            values = [r[metric] for r in results]
-            statistics[metric] = {
-                "mean": np.mean(values),
-                "min": np.min(values),
-                "max": np.max(values),
-                "std": np.std(values),
-                "values": values,
+        Args:
+            result: Resultado de run_single_experiment
+            position: Posición de la semilla en la lista de semillas
+            metrics: Array de métricas por ejecución
+            results: Lista de resultados en memoria (None si se vuelcan a disco)
+            runs_file: Archivo JSON Lines abierto (None si se guardan en memoria)
+        """
+        metrics[position] = [result[metric] for metric in STATISTICS_METRICS]
+        if runs_file is None:
+            results[position] = result
+        else:
+            run = {
+                key: value for key, value in result.items() if key != "preprocessing"
             }
+            runs_file.write(json.dumps(run, default=to_json_value) + "\n")
+
+    def _run_seed(
+        self,
+        seed: Optional[int],
+        mode: Literal["A", "B", "C"] = "A",
+        verbose: bool = False,
+        apply_preprocessing: bool = True,
+    ) -> Tuple[Dict, str]:
+        """
+        Ejecuta una semilla en un proceso trabajador.
+
+        La salida por pantalla de la ejecución se captura y se devuelve para que
+        el proceso principal la escriba en orden, sin mezclar ejecuciones.
+
+        Args:
+            seed: Semilla para reproducibilidad
+            mode: Modo de preprocesamiento
+            verbose: Mostrar información detallada
+            apply_preprocessing: Si se debe aplicar preprocesamiento (True) o no (False)
+
+        Returns:
+            Tupla (resultado de la ejecución, salida capturada)
+        """
+        output = io.StringIO()
+        with redirect_stdout(output):
+            # El minimizador se reutiliza entre las semillas de este trabajador
+            # y desaparece con el proceso al cerrar el ProcessPoolExecutor
+            result = self.run_single_experiment(
+                seed, mode, verbose, apply_preprocessing, _keep_cached=True
+            )
+        return result, output.getvalue()
+
+    def _calculate_statistics(self, values: np.ndarray) -> Dict:
+        """
+        Calcula estadísticas agregadas de múltiples ejecuciones.
+
+        Args:
+            values: Métricas de cada ejecución, una fila por ejecución y una
+                    columna por métrica (en el orden de STATISTICS_METRICS)
+
+        Returns:
+            Diccionario con estadísticas (media, min, max, std) por métrica. Los
+            valores de cada ejecución se exponen una sola vez en "_raw" (el
+            propio array de entrada)
+        """
+        # Cada estadístico se calcula con una única reducción por ejes sobre
+        # toda la tabla
+        means = values.mean(axis=0)
+        mins = values.min(axis=0)
+        maxs = values.max(axis=0)
+        stds = values.std(axis=0)
+
+        statistics = {
+            metric: {
+                "mean": means[j],
+                "min": mins[j],
+                "max": maxs[j],
+                "std": stds[j],
+            }
+            for j, metric in enumerate(STATISTICS_METRICS)
+        }
+        statistics["_raw"] = values
 
         return statistics
 
@@ -199,85 +564,18 @@ class ExperimentalDesign:
         stats = experiment_results["statistics"]
         config = experiment_results["configuration"]
 
-        print(f"\n{'=' * 80}")
-        print("REPORTE DE ESTADÍSTICAS - DISEÑO EXPERIMENTAL")
-        print(f"{'=' * 80}")
-        print(f"\nCONFIGURACIÓN:")
-        print(f"  Archivo: {config['matrix_path']}")
-        print(f"  Modo de preprocesamiento: {config['mode']}")
-        print(f"  Estrategia inicial: {config['initial_strategy']}")
-        print(f"  Número de ejecuciones: {config['num_runs']}")
-        print(f"  Semillas: {config['seeds']}")
-
-        print(f"\n{'=' * 80}")
-        print("RESULTADOS AGREGADOS")
-        print(f"{'=' * 80}\n")
+        # Aplanar las estadísticas: {"tssr_mean": ..., "tssr_min": ..., ...}
+        fields = {
+            f"{metric}_{stat}": value
+            for metric, metric_stats in stats.items()
+            if not metric.startswith("_")
+            for stat, value in metric_stats.items()
+        }
+        fields.update(config)
+        fields["rule"] = "=" * 80
 
-        # Tiempo de ejecución
-        exec_time = stats["execution_time"]
-        print("TIEMPO DE EJECUCIÓN (segundos):")
-        print(f"  Media:           {exec_time['mean']:>10.4f}s")
-        print(f"  Mínimo:          {exec_time['min']:>10.4f}s")
-        print(f"  Máximo:          {exec_time['max']:>10.4f}s")
-        print(f"  Desv. Estándar:  {exec_time['std']:>10.4f}s")
-
-        # Tamaño de solución
-        sol_size = stats["solution_size"]
-        print("\nTAMAÑO DE SOLUCIÓN (tests):")
-        print(f"  Media:           {sol_size['mean']:>10.2f}")
-        print(f"  Mínimo:          {sol_size['min']:>10.0f}")
-        print(f"  Máximo:          {sol_size['max']:>10.0f}")
-        print(f"  Desv. Estándar:  {sol_size['std']:>10.2f}")
-
-        # Reducción
-        reduction = stats["reduction"]
-        print("\nREDUCCIÓN (tests eliminados):")
-        print(f"  Media:           {reduction['mean']:>10.2f}")
-        print(f"  Mínimo:          {reduction['min']:>10.0f}")
-        print(f"  Máximo:          {reduction['max']:>10.0f}")
-        print(f"  Desv. Estándar:  {reduction['std']:>10.2f}")
-
-        # Porcentaje de reducción
-        red_pct = stats["reduction_percentage"]
-        print("\nPORCENTAJE DE REDUCCIÓN (%):")
-        print(f"  Media:           {red_pct['mean']:>10.2f}%")
-        print(f"  Mínimo:          {red_pct['min']:>10.2f}%")
-        print(f"  Máximo:          {red_pct['max']:>10.2f}%")
-        print(f"  Desv. Estándar:  {red_pct['std']:>10.2f}%")
-
-        # TSSR
-        tssr = stats["tssr"]
-        print("\nTSSR (Test Suite Size Reduction):")
-        print(f"  Media:           {tssr['mean']:>10.4f}")
-        print(f"  Mínimo:          {tssr['min']:>10.4f}")
-        print(f"  Máximo:          {tssr['max']:>10.4f}")
-        print(f"  Desv. Estándar:  {tssr['std']:>10.4f}")
-
-        # FDCLOSS
-        fdcloss = stats["fdcloss"]
-        print("\nFDCLOSS (Fault Detection Capability Loss):")
-        print(f"  Media:           {fdcloss['mean']:>10.4f}")
-        print(f"  Mínimo:          {fdcloss['min']:>10.4f}")
-        print(f"  Máximo:          {fdcloss['max']:>10.4f}")
-        print(f"  Desv. Estándar:  {fdcloss['std']:>10.4f}")
-
-        # Iteraciones
-        iterations = stats["iterations"]
-        print("\nITERACIONES:")
-        print(f"  Media:           {iterations['mean']:>10.2f}")
-        print(f"  Mínimo:          {iterations['min']:>10.0f}")
-        print(f"  Máximo:          {iterations['max']:>10.0f}")
-        print(f"  Desv. Estándar:  {iterations['std']:>10.2f}")
-
-        # Mejoras
-        improvements = stats["improvements"]
-        print("\nMEJORAS:")
-        print(f"  Media:           {improvements['mean']:>10.2f}")
-        print(f"  Mínimo:          {improvements['min']:>10.0f}")
-        print(f"  Máximo:          {improvements['max']:>10.0f}")
-        print(f"  Desv. Estándar:  {improvements['std']:>10.2f}")
-
-        print(f"\n{'=' * 80}\n")
+        # Todo el reporte en una única escritura
+        sys.stdout.write(STATISTICS_REPORT_TEMPLATE.format_map(fields))
 
     def run_deterministic_experiment(
         self, seed: int = 42, mode: Literal["A", "B", "C"] = "A"
@@ -311,6 +609,7 @@ class ExperimentalDesign:
         print("RESULTADO ÚNICO")
         print(f"{'=' * 80}")
         print(f"Tiempo de ejecución: {result['execution_time']:.4f}s")
+        print(f"Tiempo de CPU: {result['cpu_time']:.4f}s")
         print(f"Tamaño de solución: {result['solution_size']} tests")
         print(
             f"Reducción: {result['reduction']} tests ({result['reduction_percentage']:.2f}%)"
@@ -7,6 +7,8 @@ conjuntos de tests, manteniendo la cobertura completa de requisitos.
 
 import numpy as np
 
+from src._hc_kernel import first_removable, is_covered_bitset
+
 
 class HillClimbingOptimizer:
     """
@@ -16,14 +18,17 @@ class HillClimbingOptimizer:
     que busca reducir el número de tests manteniendo la cobertura completa.
     """
 
-    def __init__(self, minimizer):
+    def __init__(self, minimizer, rng=None):
         """
         Inicializa el optimizador con un TestSuiteMinimizer.
 
         Args:
             minimizer: Instancia de TestSuiteMinimizer con matriz cargada
+            rng (numpy.random.Generator): Generador aleatorio de la ejecución
+                                          (None para crear uno sin semilla)
         """
         self.minimizer = minimizer
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.coverage_matrix = minimizer.coverage_matrix
         self.num_requirements = minimizer.num_requirements
         self.num_tests = minimizer.num_tests
@@ -52,101 +57,99 @@ class HillClimbingOptimizer:
         elif strategy == "random":
             # Estrategia aleatoria: añadir tests en orden aleatorio hasta cubrir todo
             solution = []
-            uncovered = set(range(self.num_requirements))
+            covers = self.coverage_matrix == 1
+            uncovered = np.ones(self.num_requirements, dtype=bool)
+            num_uncovered = self.num_requirements
             available_tests = list(range(self.num_tests))
-            np.random.shuffle(available_tests)  # Orden aleatorio
+            self.rng.shuffle(available_tests)  # Orden aleatorio
 
             for test_idx in available_tests:
-                if not uncovered:
+                if not num_uncovered:
                     break
-                
-                # Ver qué requisitos cubre este test
-                covered_by_test = set(
-                    np.where(self.coverage_matrix[test_idx, :] == 1)[0]
-                )
-                
+
+                # Requisitos no cubiertos que cubre este test
+                new_coverage = np.count_nonzero(covers[test_idx] & uncovered)
+
                 # Si cubre algún requisito no cubierto, añadirlo
-                if covered_by_test & uncovered:
+                if new_coverage:
                     solution.append(test_idx)
-                    uncovered -= covered_by_test
+                    uncovered &= ~covers[test_idx]
+                    num_uncovered -= new_coverage
 
             return sorted(solution)
 
         elif strategy == "greedy":
             # Estrategia greedy: añadir el test que cubre más requisitos no cubiertos
             solution = []
-            uncovered = set(range(self.num_requirements))
-
-            while uncovered:
-                best_test = -1
-                best_coverage = 0
-
-                for test_idx in range(self.num_tests):
-                    if test_idx in solution:
-                        continue
-
-                    # Contar cuántos requisitos no cubiertos cubre este test
-                    covered_by_test = set(
-                        np.where(self.coverage_matrix[test_idx, :] == 1)[0]
-                    )
-                    new_coverage = len(covered_by_test & uncovered)
-
-                    if new_coverage > best_coverage:
-                        best_coverage = new_coverage
-                        best_test = test_idx
-
-                if best_test == -1:
+            # Ganancia de todos los tests a la vez: producto matriz-vector con el
+            # vector de requisitos no cubiertos (1.0 = no cubierto). En float32
+            # el recuento es exacto (< 2**24) y el producto lo resuelve BLAS
+            tests = self.coverage_matrix.astype(np.float32)
+            uncovered = np.ones(self.num_requirements, dtype=np.float32)
+
+            while True:
+                # Cuántos requisitos no cubiertos cubre cada test
+                gains = tests @ uncovered
+                # argmax devuelve el primer test con la ganancia máxima
+                best_test = int(gains.argmax())
+
+                if gains[best_test] == 0:
                     break
 
                 solution.append(best_test)
-                covered_by_best = set(
-                    np.where(self.coverage_matrix[best_test, :] == 1)[0]
-                )
-                uncovered -= covered_by_best
+                uncovered[self.coverage_matrix[best_test] == 1] = 0
 
             return solution
 
         elif strategy == "essential":
-            # Solo tests esenciales (cubren requisitos únicos)
-            from src.utils import get_essential_tests
-
-            essential = get_essential_tests(self.coverage_matrix)
-            return sorted(list(essential))
+            # Solo tests esenciales (cubren requisitos únicos), calculados al
+            # establecer la matriz
+            return np.flatnonzero(self.minimizer.essential_mask).tolist()
 
         else:
             raise ValueError(f"Estrategia desconocida: {strategy}")
 
-    def generate_neighbors(self, current_solution):
+    def is_covered(self, solution):
         """
-        Genera vecinos de la solución actual.
+        Indica si una solución cubre todos los requisitos cubiertos por la matriz.
 
-        Un vecino se genera:
-        - Eliminando un test de la solución actual, O
-        - Añadiendo un test no incluido en la solución
+        Hace el OR de los bitsets de los tests de la solución y lo compara con
+        los requisitos cubiertos por la matriz completa, en una sola pasada
+        (ver is_covered_bitset()).
 
         Args:
-            current_solution (list): Solución actual
+            solution (list): Lista de índices de tests
 
         Returns:
-            list: Lista de soluciones vecinas (cada una es una lista de índices)
+            bool: True si mantiene cobertura completa
         """
-        neighbors = []
-        current_set = set(current_solution)
+        if not solution:
+            return False
 
-        # Vecinos por ELIMINACIÓN: quitar un test
-        for test_idx in current_solution:
-            neighbor = [t for t in current_solution if t != test_idx]
-            # Solo considerar si no deja la solución vacía
-            if neighbor:
-                neighbors.append(neighbor)
+        return is_covered_bitset(
+            self.minimizer.test_bits,
+            np.asarray(solution, dtype=np.intp),
+            self.minimizer.full_mask,
+        )
 
-        # Vecinos por ADICIÓN: añadir un test no incluido
-        for test_idx in range(self.num_tests):
-            if test_idx not in current_set:
-                neighbor = sorted(current_solution + [test_idx])
-                neighbors.append(neighbor)
+    def evaluate_solution_fast(self, solution):
+        """
+        Evalúa una solución sin calcular la penalización de las no válidas.
 
-        return neighbors
+        Para la búsqueda solo importa si la solución es válida y su tamaño, así
+        que las soluciones no válidas reciben directamente fitness infinito.
+
+        Args:
+            solution (list): Lista de índices de tests
+
+        Returns:
+            tuple: (fitness, is_valid)
+                  fitness: Número de tests, o infinito si no es válida
+                  is_valid: True si mantiene cobertura completa
+        """
+        if self.is_covered(solution):
+            return len(solution), True
+        return float("inf"), False
 
     def evaluate_solution(self, solution):
         """
@@ -167,14 +170,11 @@ class HillClimbingOptimizer:
         if not solution:
             return float("inf"), False
 
-        # Verificar cobertura
-        is_valid = self.minimizer.check_solution_coverage(solution)
-
         # Fitness: número de tests (menor es mejor)
+        fitness, is_valid = self.evaluate_solution_fast(solution)
+
         # Si no es válida, penalizar fuertemente
-        if is_valid:
-            fitness = len(solution)
-        else:
+        if not is_valid:
             # Penalización: tests + porcentaje faltante * factor
             coverage_pct = self.minimizer.calculate_coverage_percentage(solution)
             missing_pct = 100 - coverage_pct
@@ -194,9 +194,9 @@ class HillClimbingOptimizer:
 
         El algoritmo:
         1. Parte de una solución inicial
-        2. Genera vecinos (añadir/quitar un test)
-        3. Evalúa todos los vecinos
-        4. Si encuentra un mejor vecino válido, se mueve a él
+        2. Recorre los vecinos (añadir/quitar un test) en orden aleatorio
+        3. Se mueve al primer vecino válido que mejora (primera mejora)
+        4. Repite desde ese vecino
         5. Repite hasta que no haya mejora (máximo local) o max_iterations
 
         Args:
@@ -230,75 +230,96 @@ class HillClimbingOptimizer:
         iteration = 0
         improvements = 0
         evaluations = 1  # Contamos la evaluación inicial
-        best_solution = current_solution.copy()
+        # Solo se aceptan movimientos que mejoran, así que la solución actual es
+        # siempre la mejor encontrada
         best_fitness = current_fitness
 
-        history = [
-            {
-                "iteration": 0,
-                "solution_size": len(current_solution),
-                "fitness": current_fitness,
-                "valid": current_valid,
-            }
-        ]
+        # Historial en arrays preasignados: como mucho hay una mejora por
+        # iteración, más la entrada de la solución inicial
+        history_iteration = np.empty(max_iterations + 1, dtype=np.int32)
+        history_size = np.empty(max_iterations + 1, dtype=np.int32)
+        history_fitness = np.empty(max_iterations + 1, dtype=np.float64)
+        history_valid = np.empty(max_iterations + 1, dtype=bool)
+        history_iteration[0] = 0
+        history_size[0] = len(current_solution)
+        history_fitness[0] = current_fitness
+        history_valid[0] = current_valid
+
+        # Vector de recuentos: count[r] = tests de la solución que cubren r. Cada
+        # vecino difiere en un solo test, así que su validez se deduce de count
+        # sin construir ni evaluar la solución vecina
+        covers = self.coverage_matrix == 1
+        required = covers.any(axis=0)  # Requisitos cubiertos por la matriz completa
+        count = covers[current_solution].sum(axis=0, dtype=np.int32)
+        # La solución es un conjunto: se representa con una máscara y solo se
+        # ordena al final
+        selected_mask = np.zeros(self.num_tests, dtype=bool)
+        selected_mask[current_solution] = True
+        solution_size = int(selected_mask.sum())
+        essential_mask = self.minimizer.essential_mask
 
         # Bucle principal
         while iteration < max_iterations:
             iteration += 1
 
-            # Generar vecinos
-            neighbors = self.generate_neighbors(current_solution)
-            evaluations += len(neighbors)
-
-            # Evaluar vecinos y mantener TODOS los que empatan con el mejor
-            best_neighbors = []
-            best_neighbor_fitness = float("inf")
-            best_neighbor_valid = False
-
-            for neighbor in neighbors:
-                fitness, is_valid = self.evaluate_solution(neighbor)
-
-                # Solo considerar vecinos válidos (cobertura completa)
-                if is_valid:
-                    if fitness < best_neighbor_fitness:
-                        # Encontramos un vecino mejor, reiniciar la lista
-                        best_neighbors = [neighbor]
-                        best_neighbor_fitness = fitness
-                        best_neighbor_valid = is_valid
-                    elif fitness == best_neighbor_fitness:
-                        # Empate: agregar a la lista de candidatos
-                        best_neighbors.append(neighbor)
-            
-            # Si hay múltiples mejores vecinos (empate), elegir UNO AL AZAR
-            best_neighbor = None
-            if best_neighbors:
-                best_neighbor = best_neighbors[np.random.randint(len(best_neighbors))]
-
-            # Si encontramos un mejor vecino, movernos a él
-            if best_neighbor is not None and best_neighbor_fitness < current_fitness:
-                current_solution = best_neighbor
-                current_fitness = best_neighbor_fitness
-                current_valid = best_neighbor_valid
+            # Primera mejora: se prueban los movimientos en orden aleatorio y se
+            # aplica el primero válido (equivale a elegir uno al azar entre los
+            # válidos, sin evaluar todos)
+            test_idx = -1
+            if current_valid:
+                # Solo mejoran las eliminaciones (fitness = tamaño - 1), siempre que
+                # no dejen la solución vacía. Quitar t es válido si t no es el
+                # único test que cubre alguno de sus requisitos, así que los
+                # tests esenciales ni se prueban
+                move_fitness = solution_size - 1
+                if solution_size > 1:
+                    order = self.rng.permutation(
+                        np.flatnonzero(selected_mask & ~essential_mask)
+                    )
+                    position = first_removable(covers, order, count)
+                    if position >= 0:
+                        evaluations += position + 1
+                        test_idx = int(order[position])
+                    else:
+                        evaluations += len(order)
+            else:
+                # Desde una solución sin cobertura completa solo son válidas las
+                # adiciones de un test que cubra todo lo que falta
+                move_fitness = solution_size + 1
+                order = self.rng.permutation(np.flatnonzero(~selected_mask))
+                missing = required & (count == 0)
+                completes = covers[np.ix_(order, missing)].all(axis=1)
+                if completes.any():
+                    position = int(completes.argmax())
+                    evaluations += position + 1
+                    test_idx = int(order[position])
+                else:
+                    evaluations += len(order)
+
+            # Si encontramos un movimiento que mejora, aplicarlo
+            if test_idx >= 0 and move_fitness < current_fitness:
+                if selected_mask[test_idx]:
+                    count -= covers[test_idx]
+                    solution_size -= 1
+                else:
+                    count += covers[test_idx]
+                    solution_size += 1
+                selected_mask[test_idx] = not selected_mask[test_idx]
+                current_fitness = move_fitness
+                current_valid = True
                 improvements += 1
 
                 if verbose and improvements % 10 == 0:
                     print(
-                        f"Iteración {iteration}: {len(current_solution)} tests (fitness: {current_fitness:.2f})"
+                        f"Iteración {iteration}: {solution_size} tests (fitness: {current_fitness:.2f})"
                     )
 
-                # Actualizar mejor solución global
-                if current_fitness < best_fitness:
-                    best_solution = current_solution.copy()
-                    best_fitness = current_fitness
-
-                history.append(
-                    {
-                        "iteration": iteration,
-                        "solution_size": len(current_solution),
-                        "fitness": current_fitness,
-                        "valid": current_valid,
-                    }
-                )
+                best_fitness = current_fitness
+
+                history_iteration[improvements] = iteration
+                history_size[improvements] = solution_size
+                history_fitness[improvements] = current_fitness
+                history_valid[improvements] = current_valid
             else:
                 # No hay mejora - máximo local alcanzado
                 if verbose:
@@ -306,18 +327,39 @@ class HillClimbingOptimizer:
                 break
 
         # Resultado final
-        final_coverage = self.minimizer.calculate_coverage_percentage(best_solution)
+        best_solution = np.flatnonzero(selected_mask).tolist()  # Ya ordenada
+        # Una solución válida cubre por definición el 100% de los requisitos: el
+        # porcentaje solo se calcula cuando no lo es
+        if current_valid:
+            final_coverage = 100.0
+        else:
+            final_coverage = self.minimizer.calculate_coverage_percentage(best_solution)
         reduction_pct = (1 - len(best_solution) / self.num_tests) * 100
 
-        # Calcular métricas TSSR y FDCLOSS
-        from src.utils import calculate_fdcloss, calculate_tssr
+        # El historial como lista de diccionarios se construye una sola vez
+        history = [
+            {
+                "iteration": int(history_iteration[i]),
+                "solution_size": int(history_size[i]),
+                "fitness": float(history_fitness[i]),
+                "valid": bool(history_valid[i]),
+            }
+            for i in range(improvements + 1)
+        ]
+
+        # Calcular métricas TSSR y FDCLOSS (respecto a todos los tests, con la
+        # cobertura original que el minimizer ya tiene calculada). Una solución
+        # válida no pierde ningún requisito, así que su FDCLOSS es 0
+        from src.utils import calculate_tssr
 
-        original_tests = list(range(self.num_tests))
         tssr = calculate_tssr(self.num_tests, len(best_solution))
-        fdcloss = calculate_fdcloss(self.coverage_matrix, original_tests, best_solution)
+        if current_valid:
+            fdcloss = 0.0
+        else:
+            fdcloss = self.minimizer.calculate_fdcloss(best_solution)
 
         result = {
-            "solution": sorted(best_solution),
+            "solution": best_solution,
             "solution_size": len(best_solution),
             "original_size": self.num_tests,
             "reduction": self.num_tests - len(best_solution),
@@ -358,12 +400,12 @@ class HillClimbingOptimizer:
             print(f"{'=' * 70}")
             
             # Obtener submatriz con solo los tests de la solución
-            result_matrix = self.coverage_matrix[sorted(best_solution), :]
+            result_matrix = self.coverage_matrix[best_solution, :]
             num_tests_actual = result_matrix.shape[0]
             num_reqs_actual = result_matrix.shape[1]
             
             print(f"Dimensiones: {num_tests_actual} tests x {num_reqs_actual} requisitos")
-            print(f"Tests seleccionados: {sorted(best_solution)}\n")
+            print(f"Tests seleccionados: {best_solution}\n")
             
             # Imprimir la matriz
             print("Matriz de cobertura (1 = cubierto, 0 = no cubierto):")
@@ -371,7 +413,7 @@ class HillClimbingOptimizer:
             
             # Encabezado con índices de tests
             header = "Req |"
-            for test_idx in sorted(best_solution):
+            for test_idx in best_solution:
                 header += f" T{test_idx:>3} |"
             print(header)
             print("-" * len(header))
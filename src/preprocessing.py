@@ -11,6 +11,9 @@ from typing import Literal
 
 import numpy as np
 
+from src._preprocessing_kernel import dominated_rows
+from src.utils import count_coverage_bits, pack_coverage_bits
+
 
 class PreprocessingModes:
     """
@@ -35,70 +38,84 @@ class PreprocessingModes:
         Returns:
             tuple: (matriz_reducida, indices_tests_mantenidos, info_eliminacion)
         """
-        num_tests, num_requirements = coverage_matrix.shape
-        tests_to_keep = []
-
-        # Información de eliminación
-        empty_tests = []
-        duplicate_tests = []
-        dominated_tests = []
-
-        # 1. Identificar tests vacíos (no cubren ningún requisito)
-        for test_idx in range(num_tests):
-            if np.sum(coverage_matrix[test_idx, :]) == 0:
-                empty_tests.append(test_idx)
-
-        # Tests no vacíos
-        non_empty_tests = [i for i in range(num_tests) if i not in empty_tests]
-
-        # 2 y 3. Identificar duplicados y dominados
-        # Marcamos tests para eliminar
-        to_remove = set()
-
-        for i in range(len(non_empty_tests)):
-            test_i = non_empty_tests[i]
+        tests_to_keep, elimination_info = PreprocessingModes._select_tests(
+            pack_coverage_bits(coverage_matrix)
+        )
+        return coverage_matrix[tests_to_keep, :], tests_to_keep, elimination_info
 
-            if test_i in to_remove:
-                continue
+    @staticmethod
+    def _select_tests(bits):
+        """
+        Calcula los tests que conserva el Modo A, sin construir la matriz
+        reducida (ver _apply_mode_a()).
 
-            coverage_i = coverage_matrix[test_i, :]
+        Trabaja sobre la cobertura de cada test como bitset uint64: igualdad y
+        contención se comprueban palabra a palabra en lugar de requisito a
+        requisito. Los bits de los requisitos que no cuentan deben estar a 0
+        (el Modo C los enmascara en lugar de construir la submatriz).
 
-            for j in range(i + 1, len(non_empty_tests)):
-                test_j = non_empty_tests[j]
+        Args:
+            bits (numpy.ndarray): Bitsets de los tests (ver pack_coverage_bits())
 
-                if test_j in to_remove:
-                    continue
+        Returns:
+            tuple: (indices_tests_mantenidos, info_eliminacion)
+        """
+        num_tests = bits.shape[0]
+        tests_to_keep = []
+        popcounts = count_coverage_bits(bits, axis=1)
 
-                coverage_j = coverage_matrix[test_j, :]
+        # 1. Identificar tests vacíos (no cubren ningún requisito)
+        empty_tests = np.flatnonzero(popcounts == 0).tolist()
 
-                # Verificar si son duplicados
-                if np.array_equal(coverage_i, coverage_j):
-                    # Duplicado - eliminar el segundo (j)
-                    duplicate_tests.append(test_j)
-                    to_remove.add(test_j)
-                else:
-                    # Verificar dominancia (SOLO UNIDIRECCIONAL: i -> j)
-                    # test_i domina a test_j si cubre todo lo de j y más
-                    i_covers_j = np.all(coverage_j <= coverage_i)
-                    i_covers_more = not np.array_equal(coverage_i, coverage_j)
+        # Tests no vacíos
+        non_empty_tests = np.flatnonzero(popcounts)
+
+        # 2. Agrupar los duplicados: cada test (por su posición en
+        # non_empty_tests) se asocia a un grupo por cobertura, cuyo representante
+        # es el primer test del grupo. np.unique ordena los bitsets en lugar de
+        # compararlos por pares
+        _, representative_positions, groups = np.unique(
+            bits[non_empty_tests], axis=0, return_index=True, return_inverse=True
+        )
+        # Numerar los grupos por orden de aparición de su representante
+        order = np.argsort(representative_positions)
+        representative_positions = representative_positions[order]
+        group_rank = np.empty_like(order)
+        group_rank[order] = np.arange(len(order))
+        groups = group_rank[groups.ravel()]
+        representatives = non_empty_tests[representative_positions]
+
+        # 3. Identificar representantes dominados (SOLO UNIDIRECCIONAL: i -> j)
+        # test_i domina a test_j (i < j) si cubre todo lo de j y más. Basta con
+        # comparar representantes: un test anterior con la misma cobertura que
+        # test_i tendría un índice menor.
+        # NOTA: No permitimos que test_j elimine a test_i. Basta con que domine
+        # cualquier test anterior: si ese test estuviera dominado, su dominante
+        # también dominaría a test_j
+        dominated = dominated_rows(
+            bits[representatives], popcounts[representatives], earlier_only=True
+        )
 
-                    if i_covers_j and i_covers_more:
-                        # test_i domina a test_j, eliminar test_j
-                        dominated_tests.append(test_j)
-                        to_remove.add(test_j)
-                    # NOTA: No permitimos que test_j elimine a test_i
-                    # porque test_i ya fue validado contra todos los tests anteriores.
-                    # Esto previene cadenas de dominancia que reducen demasiado la suite.
+        # A cada test lo elimina el primer test anterior que lo contiene. Si su
+        # representante está dominado, el dominante es anterior a todo el grupo
+        # y el test cuenta como dominado; si no, los que no son el
+        # representante son duplicados
+        removed_dominated = dominated[groups]
+        removed_duplicate = np.ones(len(non_empty_tests), dtype=bool)
+        removed_duplicate[representative_positions] = False
+        removed_duplicate &= ~removed_dominated
+        dominated_tests = non_empty_tests[removed_dominated].tolist()
+        duplicate_tests = non_empty_tests[removed_duplicate].tolist()
 
         # Tests que se mantienen
-        tests_to_keep = [t for t in non_empty_tests if t not in to_remove]
+        removed = removed_dominated | removed_duplicate
+        tests_to_keep = non_empty_tests[~removed].tolist()
 
         # Si no queda ningún test, mantener al menos uno
         if len(tests_to_keep) == 0:
-            tests_to_keep = non_empty_tests[:1] if non_empty_tests else [0]
-
-        # Crear matriz reducida
-        reduced_matrix = coverage_matrix[tests_to_keep, :]
+            tests_to_keep = (
+                non_empty_tests[:1].tolist() if non_empty_tests.size else [0]
+            )
 
         elimination_info = {
             "empty": empty_tests,
@@ -111,7 +128,7 @@ class PreprocessingModes:
             "remaining_tests": len(tests_to_keep),
         }
 
-        return reduced_matrix, tests_to_keep, elimination_info
+        return tests_to_keep, elimination_info
 
     @staticmethod
     def _apply_mode_b(coverage_matrix):
@@ -120,7 +137,9 @@ class PreprocessingModes:
 
         Elimina:
         1. Requisitos no cubiertos por ningún test
-        2. Requisitos dominados
+        2. Requisitos duplicados (los cubren exactamente los mismos tests); se
+           conserva el primero
+        3. Requisitos dominados
 
         Dominancia: r1 domina a r2 si el conjunto de tests que cubre r2 es un
         subconjunto estricto de los tests que cubren r1 (r1 es más difícil de satisfacer).
@@ -131,72 +150,110 @@ class PreprocessingModes:
         Returns:
             tuple: (matriz_reducida, indices_requisitos_mantenidos, info_eliminacion)
         """
-        num_tests, num_requirements = coverage_matrix.shape
-        requirements_to_keep = []
-
-        # Información de eliminación
-        uncovered_reqs = []
-        dominated_reqs = []
-
-        # 1. Identificar requisitos no cubiertos
-        for req_idx in range(num_requirements):
-            if np.sum(coverage_matrix[:, req_idx]) == 0:
-                uncovered_reqs.append(req_idx)
-
-        # Requisitos cubiertos
-        covered_reqs = [i for i in range(num_requirements) if i not in uncovered_reqs]
-
-        # 2. Identificar requisitos dominados
-        to_remove = set()
+        requirements_to_keep, elimination_info = (
+            PreprocessingModes._select_requirements(
+                pack_coverage_bits(coverage_matrix.T)
+            )
+        )
+        return (
+            coverage_matrix[:, requirements_to_keep],
+            requirements_to_keep,
+            elimination_info,
+        )
 
-        for i in range(len(covered_reqs)):
-            req_i = covered_reqs[i]
+    @staticmethod
+    def _select_requirements(bits):
+        """
+        Calcula los requisitos que conserva el Modo B, sin construir la matriz
+        reducida (ver _apply_mode_b()).
 
-            if req_i in to_remove:
-                continue
+        Trabaja sobre el conjunto de tests que cubre cada requisito como bitset
+        uint64 (una fila por requisito). Los bits de los tests que no cuentan
+        deben estar a 0 (el Modo C los enmascara).
 
-            # Obtener tests que cubren req_i
-            tests_covering_i = set(np.where(coverage_matrix[:, req_i] == 1)[0])
+        Args:
+            bits (numpy.ndarray): Bitsets de los requisitos (ver
+                                  pack_coverage_bits() sobre la traspuesta)
 
-            for j in range(len(covered_reqs)):
-                if i == j:
-                    continue
+        Returns:
+            tuple: (indices_requisitos_mantenidos, info_eliminacion)
+        """
+        num_requirements = bits.shape[0]
+        requirements_to_keep = []
+        popcounts = count_coverage_bits(bits, axis=1)
 
-                req_j = covered_reqs[j]
+        # 1. Identificar requisitos no cubiertos
+        covered_mask = popcounts > 0
+        uncovered_reqs = np.flatnonzero(~covered_mask).tolist()
 
-                if req_j in to_remove:
-                    continue
+        # Requisitos cubiertos
+        covered_reqs = np.flatnonzero(covered_mask)
 
-                # Obtener tests que cubren req_j
-                tests_covering_j = set(np.where(coverage_matrix[:, req_j] == 1)[0])
+        # 2. Agrupar los requisitos duplicados (np.unique): cada grupo conserva
+        # solo su primer requisito. La dominancia se calcula con una columna de
+        # cada grupo y se traslada al grupo entero
+        _, unique_positions, groups = np.unique(
+            bits[covered_reqs], axis=0, return_index=True, return_inverse=True
+        )
+        unique_reqs = covered_reqs[unique_positions]
+
+        # req_i domina a req_j si los tests que cubren req_j son un subconjunto
+        # estricto de los que cubren req_i (req_i es más difícil de satisfacer).
+        # Se comparan todos los bitsets a la vez; el resultado no depende del
+        # orden, así que cualquier requisito cuenta
+        removed = dominated_rows(
+            bits[unique_reqs], popcounts[unique_reqs], earlier_only=False
+        )
 
-                # req_i domina a req_j si:
-                # - tests_covering_j es subconjunto estricto de tests_covering_i
-                # - req_i es más difícil de satisfacer (más tests lo cubren)
-                if tests_covering_j < tests_covering_i:  # < es subconjunto estricto
-                    # req_i domina a req_j, eliminar req_j
-                    dominated_reqs.append(req_j)
-                    to_remove.add(req_j)
+        # 3. Los grupos dominados se eliminan enteros; del resto, todos los
+        # requisitos salvo el primero son duplicados (máscaras por posición en
+        # covered_reqs)
+        removed_dominated = removed[groups.ravel()]
+        removed_duplicate = np.ones(len(covered_reqs), dtype=bool)
+        removed_duplicate[unique_positions] = False
+        removed_duplicate &= ~removed_dominated
+        dominated_reqs = covered_reqs[removed_dominated].tolist()
+        duplicate_reqs = covered_reqs[removed_duplicate].tolist()
 
         # Requisitos que se mantienen
-        requirements_to_keep = [r for r in covered_reqs if r not in to_remove]
+        removed = removed_dominated | removed_duplicate
+        requirements_to_keep = covered_reqs[~removed].tolist()
 
         # Si no queda ningún requisito, mantener al menos uno
         if len(requirements_to_keep) == 0:
-            requirements_to_keep = covered_reqs[:1] if covered_reqs else [0]
-
-        # Crear matriz reducida
-        reduced_matrix = coverage_matrix[:, requirements_to_keep]
+            requirements_to_keep = (
+                covered_reqs[:1].tolist() if covered_reqs.size else [0]
+            )
 
         elimination_info = {
             "uncovered": uncovered_reqs,
+            "duplicate": duplicate_reqs,
             "dominated": dominated_reqs,
-            "total_eliminated": len(uncovered_reqs) + len(dominated_reqs),
+            "total_eliminated": len(uncovered_reqs)
+            + len(duplicate_reqs)
+            + len(dominated_reqs),
             "original_requirements": num_requirements,
             "remaining_requirements": len(requirements_to_keep),
         }
 
-        return reduced_matrix, requirements_to_keep, elimination_info
+        return requirements_to_keep, elimination_info
+
+    @staticmethod
+    def _index_mask(indices, size):
+        """
+        Empaqueta un conjunto de índices como bitset, con el mismo formato que
+        las filas de pack_coverage_bits().
+
+        Args:
+            indices (numpy.ndarray): Índices cuyos bits valen 1
+            size (int): Número total de bits
+
+        Returns:
+            numpy.ndarray: Bitset (palabras uint64)
+        """
+        mask = np.zeros((1, size), dtype=bool)
+        mask[0, indices] = True
+        return pack_coverage_bits(mask)[0]
 
     @staticmethod
     def _apply_mode_c(coverage_matrix, max_iterations=10):
@@ -214,9 +271,16 @@ class PreprocessingModes:
         Returns:
             tuple: (matriz_reducida, indices_tests_mantenidos, indices_reqs_mantenidos, info)
         """
-        current_matrix = coverage_matrix.copy()
-        original_test_indices = list(range(coverage_matrix.shape[0]))
-        original_req_indices = list(range(coverage_matrix.shape[1]))
+        # La matriz original se empaqueta una sola vez en bitsets por test y por
+        # requisito. Solo se actualizan los índices de los tests y requisitos
+        # que quedan: cada reducción toma los bitsets de las filas que quedan y
+        # enmascara los bits ya eliminados, sin construir ninguna submatriz. La
+        # matriz final se construye una sola vez al terminar
+        num_tests, num_requirements = coverage_matrix.shape
+        test_bits = pack_coverage_bits(coverage_matrix)
+        req_bits = pack_coverage_bits(coverage_matrix.T)
+        original_test_indices = np.arange(num_tests)
+        original_req_indices = np.arange(num_requirements)
 
         iteration = 0
         total_tests_eliminated = 0
@@ -229,14 +293,17 @@ class PreprocessingModes:
             changes_made = False
             iter_info = {
                 "iteration": iteration,
-                "start_shape": current_matrix.shape,
+                "start_shape": (len(original_test_indices), len(original_req_indices)),
                 "tests_eliminated": 0,
                 "reqs_eliminated": 0,
             }
 
             # Aplicar reducción de tests (Modo A)
-            reduced_matrix_a, kept_test_indices, test_info = (
-                PreprocessingModes._apply_mode_a(current_matrix)
+            req_mask = PreprocessingModes._index_mask(
+                original_req_indices, num_requirements
+            )
+            kept_test_indices, test_info = PreprocessingModes._select_tests(
+                test_bits[original_test_indices] & req_mask
             )
 
             if test_info["total_eliminated"] > 0:
@@ -245,14 +312,12 @@ class PreprocessingModes:
                 iter_info["tests_eliminated"] = test_info["total_eliminated"]
 
                 # Actualizar índices originales
-                original_test_indices = [
-                    original_test_indices[i] for i in kept_test_indices
-                ]
-                current_matrix = reduced_matrix_a
+                original_test_indices = original_test_indices[kept_test_indices]
 
             # Aplicar reducción de requisitos (Modo B)
-            reduced_matrix_b, kept_req_indices, req_info = (
-                PreprocessingModes._apply_mode_b(current_matrix)
+            test_mask = PreprocessingModes._index_mask(original_test_indices, num_tests)
+            kept_req_indices, req_info = PreprocessingModes._select_requirements(
+                req_bits[original_req_indices] & test_mask
             )
 
             if req_info["total_eliminated"] > 0:
@@ -261,18 +326,24 @@ class PreprocessingModes:
                 iter_info["reqs_eliminated"] = req_info["total_eliminated"]
 
                 # Actualizar índices originales
-                original_req_indices = [
-                    original_req_indices[i] for i in kept_req_indices
-                ]
-                current_matrix = reduced_matrix_b
+                original_req_indices = original_req_indices[kept_req_indices]
 
-            iter_info["end_shape"] = current_matrix.shape
+            iter_info["end_shape"] = (
+                len(original_test_indices),
+                len(original_req_indices),
+            )
             iteration_details.append(iter_info)
 
             # Si no hubo cambios, terminar
             if not changes_made:
                 break
 
+        current_matrix = coverage_matrix[
+            np.ix_(original_test_indices, original_req_indices)
+        ]
+        original_test_indices = original_test_indices.tolist()
+        original_req_indices = original_req_indices.tolist()
+
         combined_info = {
             "iterations": iteration,
             "iteration_details": iteration_details,
@@ -348,6 +419,7 @@ class PreprocessingModes:
             print("\n--- REDUCCIÓN DE REQUISITOS ---")
             print(f"Requisitos originales: {info['original_requirements']}")
             print(f"Requisitos no cubiertos eliminados: {len(info['uncovered'])}")
+            print(f"Requisitos duplicados eliminados: {len(info['duplicate'])}")
             print(f"Requisitos dominados eliminados: {len(info['dominated'])}")
             print(f"Total requisitos eliminados: {info['total_eliminated']}")
             print(f"Requisitos restantes: {info['remaining_requirements']}")
@@ -362,6 +434,10 @@ class PreprocessingModes:
                 print(
                     f"\nRequisitos no cubiertos: {info['uncovered'][:10]}{'...' if len(info['uncovered']) > 10 else ''}"
                 )
+            if info["duplicate"]:
+                print(
+                    f"Requisitos duplicados: {info['duplicate'][:10]}{'...' if len(info['duplicate']) > 10 else ''}"
+                )
             if info["dominated"]:
                 print(
                     f"Requisitos dominados: {info['dominated'][:10]}{'...' if len(info['dominated']) > 10 else ''}"
@@ -398,8 +474,9 @@ class PreprocessingModes:
 
         print(f"{'=' * 70}\n")
 
+    @staticmethod
     def apply_preprocessing_to_minimizer(
-        self, minimizer, mode: Literal["A", "B", "C"] = "A"
+        minimizer, mode: Literal["A", "B", "C"] = "A", verbose: bool = True
     ):
         """
         Aplica preprocesamiento a un objeto TestSuiteMinimizer.
@@ -407,6 +484,7 @@ class PreprocessingModes:
         Args:
             minimizer: Objeto TestSuiteMinimizer con matriz cargada
             mode (str): Modo de preprocesamiento ('A', 'B', 'C')
+            verbose (bool): Imprimir los resultados del preprocesamiento
 
         Returns:
             dict: Diccionario con la información del preprocesamiento
@@ -416,7 +494,9 @@ class PreprocessingModes:
             return None
 
         mode = mode.upper()  # type: ignore
-        original_matrix = minimizer.coverage_matrix.copy()
+        # Los modos devuelven siempre una matriz nueva (indexación avanzada), así
+        # que no hace falta copiar la original: el resultado solo la referencia
+        original_matrix = minimizer.coverage_matrix
 
         result = {
             "mode": mode,
@@ -425,7 +505,9 @@ class PreprocessingModes:
         }
 
         if mode == "A":
-            reduced_matrix, kept_tests, info = self._apply_mode_a(original_matrix)
+            reduced_matrix, kept_tests, info = PreprocessingModes._apply_mode_a(
+                original_matrix
+            )
             result.update(
                 {
                     "reduced_matrix": reduced_matrix,
@@ -434,10 +516,13 @@ class PreprocessingModes:
                     "info": info,
                 }
             )
-            self._print_preprocessing_results("A", info)
+            if verbose:
+                PreprocessingModes._print_preprocessing_results("A", info)
 
         elif mode == "B":
-            reduced_matrix, kept_reqs, info = self._apply_mode_b(original_matrix)
+            reduced_matrix, kept_reqs, info = PreprocessingModes._apply_mode_b(
+                original_matrix
+            )
             result.update(
                 {
                     "reduced_matrix": reduced_matrix,
@@ -446,11 +531,12 @@ class PreprocessingModes:
                     "info": info,
                 }
             )
-            self._print_preprocessing_results("B", info)
+            if verbose:
+                PreprocessingModes._print_preprocessing_results("B", info)
 
         elif mode == "C":
-            reduced_matrix, kept_tests, kept_reqs, info = self._apply_mode_c(
-                original_matrix
+            reduced_matrix, kept_tests, kept_reqs, info = (
+                PreprocessingModes._apply_mode_c(original_matrix)
             )
             result.update(
                 {
@@ -460,7 +546,8 @@ class PreprocessingModes:
                     "info": info,
                 }
             )
-            self._print_preprocessing_results("C", info)
+            if verbose:
+                PreprocessingModes._print_preprocessing_results("C", info)
 
         else:
             print(f"Error: Modo '{mode}' no reconocido. Use 'A', 'B' o 'C'.")
@@ -3,11 +3,29 @@ from typing import Literal, Optional
 
 import numpy as np
 
+from src._hc_kernel import count_covered_bitset, is_covered_bitset
 from src.hill_climbing_optimizer import HillClimbingOptimizer
 from src.preprocessing import PreprocessingModes
+from src.utils import pack_coverage_bits
+
+# Bytes que no forman parte de la matriz: todo salvo '0', '1' y el salto de línea
+_NON_MATRIX_BYTES = bytes(b for b in range(256) if b not in b"01\n")
 
 
 class TestSuiteMinimizer:
+    # Atributos que _set_coverage_matrix() deriva de la matriz activa
+    _COVERAGE_STATE = (
+        "coverage_matrix",
+        "num_tests",
+        "num_requirements",
+        "test_bits",
+        "full_mask",
+        "_req_coverage",
+        "_test_coverage",
+        "_total_requirements",
+        "essential_mask",
+    )
+
     def __init__(
         self,
         matrix_path,
@@ -15,54 +33,141 @@ class TestSuiteMinimizer:
         initial_strategy: Optional[
             Literal["all", "greedy", "essential", "random"]
         ] = "all",
+        matrix: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None,
+        verbose: bool = False,
     ):
         """
         Inicializa el minimizador con una matriz de cobertura.
 
         Args:
             matrix_path (str): Ruta al archivo de matriz binaria
+            matrix (numpy.ndarray): Matriz ya cargada (tests x requisitos). Si se
+                proporciona, no se lee matrix_path
+            rng (numpy.random.Generator): Generador aleatorio propio de esta
+                ejecución (None para crear uno sin semilla)
+            verbose (bool): Mostrar la información de la matriz, del
+                preprocesamiento y del Hill Climbing (False para no imprimir
+                nada ni calcular los datos que solo se muestran)
         """
         self.matrix_path = Path(matrix_path)
-        self.coverage_matrix = None
-        self.num_requirements = 0
-        self.num_tests = 0
         self.max_iterations = max_iterations
         self.initial_strategy = initial_strategy
+        self.verbose = verbose
+
+        # La matriz original se parsea una sola vez: cada ejecución parte de ella
+        # (ver reset()) aunque el preprocesamiento sustituya coverage_matrix
+        if matrix is None:
+            matrix = self.parse_matrix_file(self.matrix_path)
+        self._set_coverage_matrix(matrix)
+
+        # Estado derivado de la matriz original, que reset() restaura sin
+        # recalcularlo
+        self._original_state = {
+            name: getattr(self, name) for name in self._COVERAGE_STATE
+        }
 
-    def load_matrix(self):
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def reset(self, rng: Optional[np.random.Generator] = None):
         """
-        Carga la matriz de cobertura desde el archivo.
+        Restaura el estado mutable para volver a ejecutar con la misma matriz.
+
+        Deshace la reducción del preprocesamiento de una ejecución anterior sin
+        volver a leer el archivo, de modo que una misma instancia puede
+        reutilizarse para varias semillas.
+
+        Args:
+            rng (numpy.random.Generator): Generador aleatorio para la siguiente
+                ejecución (None para conservar el actual)
+        """
+        self.__dict__.update(self._original_state)
+        if rng is not None:
+            self.rng = rng
+
+    def _set_coverage_matrix(self, matrix):
+        """
+        Establece la matriz de cobertura activa y los datos derivados de ella.
+
+        Además de las dimensiones, calcula una sola vez:
+        - test_bits: la cobertura de cada test empaquetada en bitsets
+        - full_mask: el OR de todos ellos, es decir, los requisitos cubiertos por
+          la matriz completa, que toda solución válida debe cubrir
+        - Los tests que cubren cada requisito y los requisitos que cubre cada
+          test (ver get_requirement_coverage() y get_test_coverage()), y el
+          número de requisitos cubiertos por la matriz completa
+        - essential_mask: los tests esenciales, únicos en cubrir algún
+          requisito. Están en toda solución válida y nunca se pueden eliminar
+
+        Args:
+            matrix (numpy.ndarray): Matriz de cobertura (tests x requisitos)
+        """
+        self.coverage_matrix = matrix
+        self.num_tests = matrix.shape[0]
+        self.num_requirements = matrix.shape[1]
+        self.test_bits = pack_coverage_bits(matrix)
+        self.full_mask = np.bitwise_or.reduce(self.test_bits, axis=0)
+        self._req_coverage = matrix.sum(axis=0, dtype=np.int32)
+        self._test_coverage = matrix.sum(axis=1, dtype=np.int32)
+        self._total_requirements = int(np.count_nonzero(self._req_coverage))
+        self.essential_mask = matrix[:, self._req_coverage == 1].any(axis=1)
+
+    @staticmethod
+    def parse_matrix_file(matrix_path):
+        """
+        Lee un archivo de matriz de cobertura.
 
         IMPORTANTE: En el archivo, cada FILA es un REQUISITO y cada COLUMNA un TEST.
         Se transpone para que internamente sea: tests x requisitos
 
+        Args:
+            matrix_path (str): Ruta al archivo de matriz binaria
+
         Returns:
-            numpy.ndarray: Matriz de cobertura (tests x requisitos)
+            numpy.ndarray: Matriz de cobertura (tests x requisitos), contigua por
+                filas (cada test es una fila contigua en memoria)
         """
-        # Leer el archivo línea por línea
-        with open(self.matrix_path, "r") as f:
-            lines = f.readlines()
+        # Leer el archivo como bytes y quedarse solo con los '0', '1' y los
+        # saltos de línea (el resto de caracteres se ignora)
+        data = Path(matrix_path).read_bytes().translate(None, _NON_MATRIX_BYTES)
+        rows = data.split()  # Ignora las líneas vacías
+
+        num_rows = len(rows)
+        num_cols = len(rows[0]) if rows else 0
+        values = np.frombuffer(b"".join(rows), dtype=np.uint8)
+        if values.size != num_rows * num_cols:
+            raise ValueError(
+                f"Las filas de la matriz {matrix_path} no tienen la misma longitud"
+            )
 
-        # Convertir cada línea en una lista de enteros
-        matrix_data = []
-        for line in lines:
-            line = line.strip()
-            if line:  # Ignorar líneas vacías
-                row = [int(char) for char in line if char in "01"]
-                matrix_data.append(row)
+        # Convertir '0'/'1' a 0/1: cada fila es un requisito, cada columna un test.
+        # Se mantiene en uint8 (1 byte por celda); las sumas sobre la matriz
+        # indican un dtype de acumulación explícito
+        matrix_reqs_x_tests = (values - ord("0")).reshape(num_rows, num_cols)
 
-        # Convertir a numpy array: cada fila es un requisito, cada columna un test
-        matrix_reqs_x_tests = np.array(matrix_data, dtype=int)
+        # TRANSPONER: necesitamos tests x requisitos internamente. Se copia en
+        # orden C para que la cobertura de cada test sea una fila contigua
+        return np.ascontiguousarray(matrix_reqs_x_tests.T)
 
-        # TRANSPONER: necesitamos tests x requisitos internamente
-        self.coverage_matrix = matrix_reqs_x_tests.T
+    def load_matrix(self):
+        """
+        Carga la matriz de cobertura desde el archivo.
 
-        self.num_tests = self.coverage_matrix.shape[0]
-        self.num_requirements = self.coverage_matrix.shape[1]
+        IMPORTANTE: En el archivo, cada FILA es un REQUISITO y cada COLUMNA un TEST.
+        Se transpone para que internamente sea: tests x requisitos
 
-        print(
-            f"Matriz cargada: {self.num_tests} tests x {self.num_requirements} requisitos"
-        )
+        El archivo se parsea una sola vez en __init__; aquí solo se restaura la
+        matriz original (ver reset()).
+
+        Returns:
+            numpy.ndarray: Matriz de cobertura (tests x requisitos)
+        """
+        self.reset()
+
+        if self.verbose:
+            print(
+                f"Matriz cargada: {self.num_tests} tests x {self.num_requirements} requisitos"
+            )
         return self.coverage_matrix
 
     def get_requirement_coverage(self):
@@ -72,9 +177,8 @@ class TestSuiteMinimizer:
         Returns:
             numpy.ndarray: Array con el número de tests que cubren cada requisito
         """
-        # Sumar por columnas (axis=0): suma todos los tests para cada requisito
-        coverage_per_requirement = np.sum(self.coverage_matrix, axis=0)  # type: ignore
-        return coverage_per_requirement
+        # Suma por columnas (axis=0) calculada en _set_coverage_matrix()
+        return self._req_coverage
 
     def get_test_coverage(self):
         """
@@ -83,9 +187,8 @@ class TestSuiteMinimizer:
         Returns:
             numpy.ndarray: Array con el número de requisitos que cubre cada test
         """
-        # Sumar por filas (axis=1): suma todos los requisitos para cada test
-        coverage_per_test = np.sum(self.coverage_matrix, axis=1)  # type: ignore
-        return coverage_per_test
+        # Suma por filas (axis=1) calculada en _set_coverage_matrix()
+        return self._test_coverage
 
     def print_matrix_info(self):
         """
@@ -107,16 +210,21 @@ class TestSuiteMinimizer:
         print(f"\nTotal de tests: {self.num_tests}")
         print(f"Total de requisitos: {self.num_requirements}")
 
+        # Requisitos cubiertos (calculado en _set_coverage_matrix()) y tests no
+        # vacíos: los no cubiertos y los vacíos son el resto
+        covered_reqs = self._total_requirements
+        non_empty_tests = np.count_nonzero(test_coverage)
+
         print("\n--- COBERTURA POR REQUISITO ---")
-        print(f"Requisitos cubiertos por al menos 1 test: {np.sum(req_coverage > 0)}")
-        print(f"Requisitos no cubiertos: {np.sum(req_coverage == 0)}")
+        print(f"Requisitos cubiertos por al menos 1 test: {covered_reqs}")
+        print(f"Requisitos no cubiertos: {self.num_requirements - covered_reqs}")
         print(f"Cobertura media por requisito: {np.mean(req_coverage):.2f} tests")
         print(f"Cobertura mínima: {np.min(req_coverage)} tests")
         print(f"Cobertura máxima: {np.max(req_coverage)} tests")
 
         print("\n--- COBERTURA POR TEST ---")
-        print(f"Tests que cubren al menos 1 requisito: {np.sum(test_coverage > 0)}")
-        print(f"Tests que no cubren nada: {np.sum(test_coverage == 0)}")
+        print(f"Tests que cubren al menos 1 requisito: {non_empty_tests}")
+        print(f"Tests que no cubren nada: {self.num_tests - non_empty_tests}")
         print(f"Cobertura media por test: {np.mean(test_coverage):.2f} requisitos")
         print(f"Cobertura mínima: {np.min(test_coverage)} requisitos")
         print(f"Cobertura máxima: {np.max(test_coverage)} requisitos")
@@ -134,15 +242,27 @@ class TestSuiteMinimizer:
         if not test_subset:
             return False
 
-        # Obtener requisitos cubiertos por el subconjunto
-        subset_matrix = self.coverage_matrix[test_subset, :]
-        covered_requirements = np.sum(subset_matrix, axis=0) > 0
+        # OR de los bitsets del subconjunto comparado con los requisitos
+        # cubiertos por la matriz completa (full_mask)
+        return is_covered_bitset(
+            self.test_bits, np.asarray(test_subset, dtype=np.intp), self.full_mask
+        )
 
-        # Obtener requisitos originalmente cubiertos
-        original_covered = np.sum(self.coverage_matrix, axis=0) > 0
+    def _count_covered(self, test_subset):
+        """
+        Cuenta los requisitos cubiertos por un subconjunto de tests.
 
-        # Verificar que todos los requisitos originales sigan cubiertos
-        return np.all(covered_requirements >= original_covered)
+        Args:
+            test_subset (list): Lista de índices de tests (no vacía)
+
+        Returns:
+            int: Número de requisitos cubiertos por el subconjunto
+        """
+        # OR de los bitsets del subconjunto y recuento de sus bits: recorre una
+        # palabra por cada 64 requisitos en lugar de un byte por requisito
+        return count_covered_bitset(
+            self.test_bits, np.asarray(test_subset, dtype=np.intp)
+        )
 
     def calculate_coverage_percentage(self, test_subset):
         """
@@ -157,72 +277,84 @@ class TestSuiteMinimizer:
         if not test_subset:
             return 0.0
 
-        subset_matrix = self.coverage_matrix[test_subset, :]
-        covered_requirements = np.sum(subset_matrix, axis=0) > 0
-        total_requirements = np.sum(np.sum(self.coverage_matrix, axis=0) > 0)
+        covered_requirements = self._count_covered(test_subset)
+        # Requisitos cubiertos por la matriz completa, calculados una sola vez
+        # en _set_coverage_matrix()
+        total_requirements = self._total_requirements
 
         if total_requirements == 0:
             return 100.0
 
-        return (np.sum(covered_requirements) / total_requirements) * 100
+        return (covered_requirements / total_requirements) * 100
+
+    def calculate_fdcloss(self, test_subset):
+        """
+        Calcula la métrica FDCLOSS de un subconjunto respecto a todos los tests.
+
+        Equivale a utils.calculate_fdcloss() con el conjunto original completo,
+        pero usa los bitsets y el número de requisitos cubiertos originalmente,
+        ya calculados en _set_coverage_matrix(), en lugar de recorrer la matriz.
+
+        Args:
+            test_subset (list): Lista de índices de tests
+
+        Returns:
+            float: Valor de FDCLOSS entre 0 y 1 (0 = sin pérdida)
+        """
+        u_t = self._total_requirements  # |U(T)|
+        if u_t == 0:
+            return 0.0  # No hay requisitos cubiertos originalmente
+
+        if not test_subset:
+            return 1.0  # Pérdida total si no hay tests en la minimización
+
+        u_s = self._count_covered(test_subset)  # |U(S)|
+        return 1 - (u_s / u_t)
 
     def run(self, mode: Literal["A", "B", "C"] = "A", apply_preprocessing: bool = True):
-        print("\n\nIniciando Test Suite Minimizer...")
+        if self.verbose:
+            print("\n\nIniciando Test Suite Minimizer...")
 
         # Cargar la matriz
         self.load_matrix()
 
-        # Mostrar información
-        self.print_matrix_info()
+        # Mostrar información (sus estadísticas solo se calculan si se muestran)
+        if self.verbose:
+            self.print_matrix_info()
 
         # Aplicar preprocesamiento según el modo seleccionado si apply_preprocessing es True
         preprocessing_result = None
         if apply_preprocessing:
-            match mode:
-                case "A":
-                    preprocessing_result = (
-                        PreprocessingModes().apply_preprocessing_to_minimizer(
-                            self, mode
-                        )
-                    )
-                case "B":
-                    preprocessing_result = (
-                        PreprocessingModes().apply_preprocessing_to_minimizer(
-                            self, mode
-                        )
-                    )
-                case "C":
-                    preprocessing_result = (
-                        PreprocessingModes().apply_preprocessing_to_minimizer(
-                            self, mode
-                        )
+            # Los tres modos comparten la misma llamada; otro valor no preprocesa
+            if mode in ("A", "B", "C"):
+                preprocessing_result = (
+                    PreprocessingModes.apply_preprocessing_to_minimizer(
+                        self, mode, verbose=self.verbose
                     )
+                )
 
             # IMPORTANTE: Actualizar la matriz del minimizer con la matriz preprocesada
             # Esto asegura que el Hill Climbing use la matriz reducida
             if preprocessing_result is not None:
-                self.coverage_matrix = preprocessing_result["reduced_matrix"]
-                # Actualizar dimensiones después del preprocesamiento
-                self.num_tests = self.coverage_matrix.shape[0]
-                self.num_requirements = self.coverage_matrix.shape[1]
-        else:
+                # Actualiza también las dimensiones y los bitsets de cobertura
+                self._set_coverage_matrix(preprocessing_result["reduced_matrix"])
+        elif self.verbose:
             print("\n⚠️  PREPROCESAMIENTO DESACTIVADO - Usando matriz original")
             print(
                 f"Dimensiones: {self.coverage_matrix.shape[0]} tests x {self.coverage_matrix.shape[1]} requisitos\n"
             )
-            self.num_tests = self.coverage_matrix.shape[0]
-            self.num_requirements = self.coverage_matrix.shape[1]
 
-        print(
-            f"\nMatriz después del preprocesamiento: {self.num_tests} tests x {self.num_requirements} requisitos"
-        )
+        if self.verbose:
+            print(
+                f"\nMatriz después del preprocesamiento: {self.num_tests} tests x {self.num_requirements} requisitos"
+            )
 
         # Ejecutar Hill Climbing Optimizer
-        optimizer = HillClimbingOptimizer(self)
+        optimizer = HillClimbingOptimizer(self, rng=self.rng)
         optimization_result = optimizer.optimize(
             initial_strategy=self.initial_strategy,  # type: ignore
             max_iterations=self.max_iterations,  # type: ignore
-            verbose=True,
+            verbose=self.verbose,
         )
 
         return {
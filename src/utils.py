@@ -2,10 +2,15 @@
 Funciones auxiliares para el algoritmo de Test Suite Minimization
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 
+# Directorio de matrices por defecto: matrices/ en la raíz del proyecto
+_DEFAULT_MATRICES_DIR = Path(__file__).resolve().parent.parent / "matrices"
+
 
 def find_critical_requirements(coverage_matrix):
     """
@@ -17,7 +22,7 @@ def find_critical_requirements(coverage_matrix):
     Returns:
         numpy.ndarray: Índices de los requisitos críticos
     """
-    req_coverage = np.sum(coverage_matrix, axis=0)
+    req_coverage = np.count_nonzero(coverage_matrix, axis=0)
     critical = np.where(req_coverage == 1)[0]
     return critical
 
@@ -30,17 +35,86 @@ def get_essential_tests(coverage_matrix):
         coverage_matrix (numpy.ndarray): Matriz de cobertura
 
     Returns:
-        set: Conjunto de índices de tests esenciales
+        numpy.ndarray: Índices de los tests esenciales, ordenados y sin
+            repetir (para consultas de pertenencia, np.searchsorted o
+            frozenset(essential_tests.tolist()))
     """
     critical_reqs = find_critical_requirements(coverage_matrix)
-    essential_tests = set()
+    if critical_reqs.size == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Cada requisito crítico lo cubre un único test: argmax por columnas
+    # devuelve a la vez el test de todos ellos
+    essential_tests = np.argmax(coverage_matrix[:, critical_reqs] != 0, axis=0)
+
+    return np.unique(essential_tests)
+
+
+def pack_coverage_bits(coverage_matrix):
+    """
+    Empaqueta la cobertura de cada test en un bitset de palabras uint64.
+
+    El bit r de la fila de un test vale 1 si el test cubre el requisito r. Cada
+    fila ocupa ceil(num_requisitos / 64) palabras y los bits sobrantes de la
+    última palabra quedan a 0, de modo que la cobertura de un subconjunto es el
+    OR de sus filas y se puede comparar palabra a palabra.
+
+    Args:
+        coverage_matrix (numpy.ndarray): Matriz de cobertura (tests x requisitos)
+
+    Returns:
+        numpy.ndarray: Bitsets (tests x palabras) de tipo uint64
+    """
+    packed = np.packbits(coverage_matrix != 0, axis=1, bitorder="little")
+
+    # Completar cada fila hasta un múltiplo de 8 bytes para verla como uint64
+    padding = -packed.shape[1] % 8
+    if padding:
+        packed = np.pad(packed, ((0, 0), (0, padding)))
+
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def count_coverage_bits(bits, axis=None):
+    """
+    Cuenta los bits a 1 de un bitset empaquetado con pack_coverage_bits().
+
+    Args:
+        bits (numpy.ndarray): Palabras uint64 del bitset (de cualquier forma)
+        axis (int): Eje sobre el que contar (None para el total); con axis=1
+                    se obtiene el recuento de cada fila de una matriz de bitsets
+
+    Returns:
+        int | numpy.ndarray: Número de bits a 1 (total, o por fila como int64)
+    """
+    if hasattr(np, "bitwise_count"):
+        # NumPy >= 2.0: popcount nativo por palabra
+        counts = np.bitwise_count(bits)
+    else:
+        words = bits.view(np.uint8).reshape(*bits.shape, 8)
+        counts = np.count_nonzero(np.unpackbits(words, axis=-1), axis=-1)
+
+    if axis is None:
+        return int(counts.sum())
+    return counts.sum(axis=axis, dtype=np.int64)
 
-    for req_idx in critical_reqs:
-        # Encontrar qué test cubre este requisito crítico
-        test_idx = np.where(coverage_matrix[:, req_idx] == 1)[0][0]
-        essential_tests.add(test_idx)
 
-    return essential_tests
+def _covered_mask(coverage_matrix, test_subset):
+    """
+    Calcula qué requisitos cubre un subconjunto de tests.
+
+    Es el paso común de calculate_coverage_percentage(), check_full_coverage()
+    y calculate_fdcloss(): cada una solo hace después el recuento que necesita.
+
+    Args:
+        coverage_matrix (numpy.ndarray): Matriz de cobertura completa
+        test_subset (list): Índices de los tests en el subconjunto (no vacío)
+
+    Returns:
+        numpy.ndarray: Máscara booleana de los requisitos cubiertos
+    """
+    # Un requisito está cubierto si al menos un test del subconjunto lo cubre
+    return np.any(coverage_matrix[test_subset, :], axis=0)
 
 
 def calculate_coverage_percentage(coverage_matrix, test_subset):
@@ -57,14 +131,10 @@ def calculate_coverage_percentage(coverage_matrix, test_subset):
     if len(test_subset) == 0:
         return 0.0
 
-    # Seleccionar solo las filas de los tests en el subconjunto
-    subset_matrix = coverage_matrix[test_subset, :]
-
-    # Un requisito está cubierto si al menos un test lo cubre
-    covered_requirements = np.sum(subset_matrix, axis=0) > 0
+    covered_requirements = _covered_mask(coverage_matrix, test_subset)
 
     total_requirements = coverage_matrix.shape[1]
-    covered_count = np.sum(covered_requirements)
+    covered_count = np.count_nonzero(covered_requirements)
 
     return (covered_count / total_requirements) * 100
 
@@ -80,13 +150,21 @@ def check_full_coverage(coverage_matrix, test_subset):
     Returns:
         bool: True si cubre todos los requisitos, False en caso contrario
     """
-    return calculate_coverage_percentage(coverage_matrix, test_subset) == 100.0
+    if len(test_subset) == 0:
+        return False
+
+    # Basta con que todos los requisitos estén cubiertos: sin recuento ni
+    # porcentaje, y all() se detiene en el primero que no lo está
+    return bool(_covered_mask(coverage_matrix, test_subset).all())
 
 
 def list_available_matrices(matrices_dir=None):
     """
     Lista todas las matrices disponibles en el directorio.
 
+    El contenido de cada directorio se lee una sola vez y se reutiliza en las
+    llamadas siguientes (ver clear_matrix_cache()).
+
     Args:
         matrices_dir (str): Ruta al directorio de matrices (opcional)
 
@@ -94,20 +172,48 @@ def list_available_matrices(matrices_dir=None):
         list: Lista de rutas a los archivos de matriz
     """
     if matrices_dir is None:
-        # Usar rutas absolutas desde el directorio del script
-        import os
+        matrices_dir = _DEFAULT_MATRICES_DIR
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(script_dir)
-        matrices_dir = os.path.join(project_root, "matrices")
-
-    matrices_path = Path(matrices_dir)
-    if not matrices_path.exists():
+    # Comprobarlo fuera de la caché: solo se guardan los directorios que
+    # existen, así que uno creado más tarde se lee en la siguiente llamada
+    if not Path(matrices_dir).exists():
         print(f"El directorio {matrices_dir} no existe")
         return []
 
-    matrix_files = sorted(matrices_path.glob("matrix_*.txt"))
-    return [str(f) for f in matrix_files]
+    # Se devuelve una lista nueva para que el llamador pueda modificarla sin
+    # alterar la caché
+    return list(_scan_matrices(str(matrices_dir)))
+
+
+@lru_cache(maxsize=None)
+def _scan_matrices(matrices_dir):
+    """
+    Busca los archivos matrix_*.txt de un directorio.
+
+    Args:
+        matrices_dir (str): Ruta a un directorio de matrices existente
+
+    Returns:
+        tuple: Rutas a los archivos de matriz, ordenadas
+    """
+    matrices_path = Path(matrices_dir)
+
+    # scandir con una comprobación de prefijo y sufijo en lugar de glob
+    with os.scandir(matrices_path) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.startswith("matrix_") and entry.name.endswith(".txt")
+        )
+    return tuple(str(matrices_path / name) for name in names)
+
+
+def clear_matrix_cache():
+    """
+    Olvida los directorios leídos por list_available_matrices(), por ejemplo
+    tras añadir o borrar matrices.
+    """
+    _scan_matrices.cache_clear()
 
 
 def calculate_tssr(original_size, minimized_size):
@@ -135,11 +241,28 @@ def calculate_tssr(original_size, minimized_size):
         >>> calculate_tssr(100, 10)  # 90% de reducción
         0.9
     """
+    reduction_count, original_size = _tssr_ratio(original_size, minimized_size)
     if original_size == 0:
         return 0.0
 
-    tssr = 1 - (minimized_size / original_size)
-    return tssr
+    return reduction_count / original_size
+
+
+def _tssr_ratio(original_size, minimized_size):
+    """
+    Devuelve TSSR como fracción entera (tests eliminados, tests originales).
+
+    Para comparar reducciones basta con multiplicar en cruz (a * d > c * b),
+    sin divisiones ni redondeos; calculate_tssr() es la versión en float.
+
+    Args:
+        original_size (int): Número de tests en el conjunto original |T|
+        minimized_size (int): Número de tests en el conjunto minimizado |S|
+
+    Returns:
+        tuple: (|T| - |S|, |T|)
+    """
+    return original_size - minimized_size, original_size
 
 
 def calculate_fdcloss(coverage_matrix, original_tests, minimized_tests):
@@ -175,9 +298,8 @@ def calculate_fdcloss(coverage_matrix, original_tests, minimized_tests):
     if len(original_tests) == 0:
         return 1.0  # Pérdida total si no hay tests originales
 
-    original_matrix = coverage_matrix[original_tests, :]
-    original_covered = np.sum(original_matrix, axis=0) > 0
-    u_t = np.sum(original_covered)  # |U(T)|
+    original_covered = _covered_mask(coverage_matrix, original_tests)
+    u_t = np.count_nonzero(original_covered)  # |U(T)|
 
     if u_t == 0:
         return 0.0  # No hay requisitos cubiertos originalmente
@@ -186,9 +308,8 @@ def calculate_fdcloss(coverage_matrix, original_tests, minimized_tests):
     if len(minimized_tests) == 0:
         return 1.0  # Pérdida total si no hay tests en la minimización
 
-    minimized_matrix = coverage_matrix[minimized_tests, :]
-    minimized_covered = np.sum(minimized_matrix, axis=0) > 0
-    u_s = np.sum(minimized_covered)  # |U(S)|
+    minimized_covered = _covered_mask(coverage_matrix, minimized_tests)
+    u_s = np.count_nonzero(minimized_covered)  # |U(S)|
 
     # Calcular FDCLOSS
     fdcloss = 1 - (u_s / u_t)
@@ -216,6 +337,8 @@ def calculate_metrics(coverage_matrix, original_tests, minimized_tests):
     original_size = len(original_tests)
     minimized_size = len(minimized_tests)
 
+    # El porcentaje se obtiene del número de tests eliminados, no de tssr * 100
+    reduction_count, _ = _tssr_ratio(original_size, minimized_size)
     tssr = calculate_tssr(original_size, minimized_size)
     fdcloss = calculate_fdcloss(coverage_matrix, original_tests, minimized_tests)
 
@@ -224,6 +347,8 @@ def calculate_metrics(coverage_matrix, original_tests, minimized_tests):
         "fdcloss": fdcloss,
         "original_size": original_size,
         "minimized_size": minimized_size,
-        "reduction_count": original_size - minimized_size,
-        "reduction_percentage": tssr * 100,
+        "reduction_count": reduction_count,
+        "reduction_percentage": (
+            reduction_count * 100 / original_size if original_size else 0.0
+        ),
     }